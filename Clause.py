@@ -1,19 +1,32 @@
 """Author: Luke Marshall
 
 This module contains the definition of a Clause object to be used in a DPLL solver"""
-from typing import Union, Iterator
-import copy
+from typing import Union, Iterator, Iterable
+from bisect import bisect_left
 from Literal import Literal
 
 
 class Clause(object):
     """Clause object in a conjunctive normal form proposition. Secondary element of a proposition,
     contains a number of Literals. Represents a list of disjunct Literals.
+
+    The Literals are kept in a tuple sorted by Literal id with no duplicates, so the two Literals
+    of a variable sit next to each other, and clauses holding the same Literals in any order are
+    equal. The hash of that tuple is computed whenever it changes, so unequal clauses are told 
+    apart by comparing hashes.
+
+    The status is cached along with the version of the Literal assignment store it was computed
+    at, and only computed again once a variable has been assigned since. Whether the clause is a
+    tautology only depends on its Literals, so it is found once whenever they change.
     
     Attributes:
-        clause: a list of Literal objects
+        clause: a tuple of Literal objects, sorted by id
+        hash: the hash value of the clause attribute
+        tautology: a boolean representing if the clause contains both Literals of a variable
         status: boolean representing the external status of the clause
-        based on the external statuses of the individual Literals it contains"""
+        based on the external statuses of the individual Literals it contains
+        status_version: the version of the Literal assignment store the status was computed at
+        """
     
     def __init__(self, *args: list[Union['Clause', Literal]]):
         """Constructor method for the Clause object
@@ -25,26 +38,42 @@ class Clause(object):
         cl = Clause(a, b)
         cl2 = Clause(cl, c)
         """
-        self.__clause = []
+        lits = []
         self.__status = None # based on the statuses of the Literals it contains
         for arg in args:
             if isinstance(arg, Literal): # if it's a Literal, add it directly
-                self.__clause.append(arg)
+                lits.append(arg)
             elif isinstance(arg, Clause): 
                 # if it's a Clause, add the literals inside it to the new Clause
-                for lit in arg:
-                    assert isinstance(lit, Literal)
-                    self.__clause.append(lit)
+                lits.extend(arg.__clause)
             elif isinstance(arg, list):
                 for item in arg:
-                    self.ADD(item)
+                    if isinstance(item, Clause):
+                        lits.extend(item.__clause)
+                    elif isinstance(item, Literal):
+                        lits.append(item)
+                    else:
+                        raise TypeError("""Clause object only accepts Literal or non-negated 
+                                        Clause objects as input.""")
             else:
                 raise TypeError("""Clause object only accepts Literal or non-negated 
                                 Clause objects as input.""")
+        self.__set_clause(lits)
         # initialize status:
         self.set_status()
-        # remove duplicates:
-        self.__filter_duplicates()
+
+    def __set_clause(self, lits: Iterable[Literal]):
+        """Sets the clause attribute to the Literals in lits sorted by id, dropping duplicates,
+        and computes its hash"""
+        self.__set_sorted(tuple(sorted(set(lits), key=Literal.get_id)))
+
+    def __set_sorted(self, lits: tuple[Literal]):
+        """Sets the clause attribute to lits, already sorted by id without duplicates, and 
+        computes its hash"""
+        self.__clause = lits
+        self.__hash = hash(lits)
+        self.__tautology = self.__tautology_check()
+        self.__status_version = None
 
     def __str__(self) -> str:
         """Returns: string representation of the Literals in clause attribute
@@ -57,6 +86,8 @@ class Clause(object):
         "['+a', '+b']"
         >>> str(cl)
         "['+a', '+b']"
+        >>> str(Clause(b, a))
+        "['+a', '+b']"
         """
         return f"{[str(lit) for lit in self.__clause]}"
     
@@ -90,30 +121,25 @@ class Clause(object):
         >>> cl.__status == True
         True
         """
-        if self.is_empty():
-            self.__status = False
-        elif self.__tautology_check():
+        self.__status_version = Literal.get_assignment_version()
+        if self.__tautology:
             self.__status = True
-        else:
-            none_in = true_in = False
-            for lit in self.__clause:
-                assert isinstance(lit, Literal)
-                lit_val = lit.get_external_status()
-                if lit_val:
-                    true_in = True
-                elif lit_val == None:
-                    none_in = True
-            if true_in:
-                self.__status = True
-            elif none_in:
-                self.__status = None
-            else:
-                self.__status = False
+            return
+        status = False # an empty clause, or one with every Literal False
+        for lit in self.__clause:
+            lit_val = lit.get_external_status()
+            if lit_val:
+                status = True
+                break
+            elif lit_val is None:
+                status = None
+        self.__status = status
             
 
     def __tautology_check(self) -> bool:
         """Returns: a boolean representing if the clause attribute contains any
-        Literals with the same variables and opposite signs
+        Literals with the same variables and opposite signs; sorted by id, the two would be
+        next to each other
         
         >>> a = Literal('a')
         >>> a2 = a.NOT()
@@ -121,23 +147,11 @@ class Clause(object):
         >>> cl.__tautology_check()
         True
         """
-        var_dict = {} # Literal variable : Literal sign
-        for lit in self.__clause:
-            assert isinstance(lit, Literal)
-            lit_var = lit.get_variable()
-            lit_sign = lit.get_sign()
-            if lit_var in var_dict:
-                if not lit_sign == var_dict[lit_var]:
-                    return True
-            else:
-                var_dict[lit_var] = lit_sign
+        lits = self.__clause
+        for i in range(len(lits) - 1):
+            if lits[i].NOT() is lits[i + 1]:
+                return True
         return False
-    
-    def __filter_duplicates(self):
-        """Removes any duplicates from clause attribute"""
-        seen = set()
-        self.__clause = [obj for obj in self.__clause if 
-                         not (obj in seen or seen.add(obj))]
 
     def get_status(self) -> bool:
         """Returns: a boolean representing the status of the clause after setting it
@@ -155,7 +169,8 @@ class Clause(object):
         >>> cl.get_status()
         True
         """
-        self.set_status()
+        if self.__status_version != Literal.get_assignment_version():
+            self.set_status()
         return self.__status
 
     def ADD(self, item: Union['Clause', Literal]) -> 'Clause':
@@ -176,30 +191,14 @@ class Clause(object):
         >>> print(cl2)
         "['+a', '+b', '+c']"
         """
-        new_clause = copy.copy(self)
+        new_clause = self.__copy__()
         if isinstance(item, Literal):
-            matched = False
-            for lit in new_clause:
-                if lit == item:
-                    if lit.get_sign() != item.get_sign():
-                        self.__status = True
-                    else:
-                        matched = True
-            if not matched:
-                self.__clause.append(item)
+            if item not in self:
+                self.__set_clause(self.__clause + (item,))
         elif isinstance(item, Clause):
             if item.is_empty():
                 return
-            for i in item:
-                matched = False
-                for lit in new_clause:
-                    if lit == i:
-                        if lit.get_sign() != i.get_sign():
-                            self.__status = True
-                        else:
-                            matched = True
-                if not matched:
-                    self.__clause.append(i)
+            self.__set_clause(self.__clause + item.__clause)
         else:
             raise TypeError("""Clause object only accepts Literal or non-negated 
                             Clause objects as input.""")
@@ -227,8 +226,10 @@ class Clause(object):
             raise TypeError("Only Literal object types may be removed from a Clause")
         if item not in self:
             raise ValueError("Literal not in Clause")
-        reduced_clause = copy.deepcopy(self)
-        reduced_clause._Clause__clause.remove(item) 
+        # removing a Literal keeps the rest sorted, so the tuple is only sliced around it
+        i = self.__clause.index(item)
+        reduced_clause = Clause()
+        reduced_clause.__set_sorted(self.__clause[:i] + self.__clause[i + 1:])
         reduced_clause.set_status()
         return reduced_clause
 
@@ -250,23 +251,19 @@ class Clause(object):
         >>> print(cl2)
         {'-a', '-b'}
         """
-        negated = copy.deepcopy(self)
-        negated_set = set()
-        for lit in negated:
-            negated_set.add(lit.NOT())
-        return negated_set
+        return {lit.NOT() for lit in self.__clause}
     
-    def get_clause(self):
-        """Returns: the clause attribute
+    def get_clause(self) -> list[Literal]:
+        """Returns: the clause attribute as a list
         
         Example:
         >>> a = Literal('a')
         >>> b = Literal('b')
         >>> cl = Clause(a, b)
-        >>> cl.get_clause:
+        >>> cl.get_clause()
         ['+a', '+b']
         """
-        return self.__clause
+        return list(self.__clause)
     
     def is_empty(self) -> bool:
         """Returns: boolean representing if clause attibute length is 0
@@ -306,36 +303,46 @@ class Clause(object):
         return self.__clause[index]
     
     def __copy__(self) -> 'Clause':
-        """Implements a shallow copy of the Clause
+        """Implements a shallow copy of the Clause; the Literals are immutable, so the copy shares
+        the clause attribute
         Returns: a shallow copy of the Clause"""
         cp = Clause()
-        cp.__clause = self.__clause.copy()
-        cp.set_status
+        cp.__clause = self.__clause
+        cp.__hash = self.__hash
+        cp.__tautology = self.__tautology
+        cp.__status = self.__status
+        cp.__status_version = self.__status_version
         return cp
     
     def __deepcopy__(self, memo: dict) -> 'Clause':
-        """Implements a deep copy of self
+        """Implements a deep copy of self, the same as a shallow copy since the Literals are 
+        immutable and interned
         Returns: a deep copy of self"""
-        cp = Clause()
+        cp = self.__copy__()
         memo[id(self)] = cp
-        cp.__clause = [copy.deepcopy(lit, memo) for lit in self.__clause]
-        cp.set_status()
         return cp
     
     def __eq__(self, other: 'Clause') -> bool:
         """Returns: a boolean representing if a List or another Clause contains the same 
-        literals as are in clause"""
-        same = False
-        if not isinstance(other, (Clause, list)):
-            return False
-        elif isinstance(other, Clause):
-            same = True if self.__clause == other.__clause else same
-        else:
-            same = True if self.__clause == other else same
-        return same
+        literals as are in clause, in any order"""
+        if isinstance(other, Clause):
+            return self.__hash == other.__hash and self.__clause == other.__clause
+        if isinstance(other, list) and all(isinstance(lit, Literal) for lit in other):
+            return self.__clause == tuple(sorted(set(other), key=Literal.get_id))
+        return False
+
+    def __hash__(self) -> int:
+        """Returns: the hash value of the clause attribute, computed when it was last changed
+        
+        Adding to a Clause changes its hash, so a Clause should not be added to while it is in a
+        set or dict."""
+        return self.__hash
     
     def __contains__(self, item: Literal) -> bool:
-        """Returns: a boolean representing if item (Literal) is in the clause attribute"""
+        """Returns: a boolean representing if item (Literal) is in the clause attribute, found
+        by binary search on the Literal ids"""
         if not isinstance(item, Literal):
             raise TypeError("A Clause cannot contain any non-Literal objects")
-        return item in self.__clause
\ No newline at end of file
+        lits = self.__clause
+        i = bisect_left(lits, item.get_id(), key=Literal.get_id)
+        return i < len(lits) and lits[i] is item
\ No newline at end of file
@@ -1,35 +1,93 @@
-import copy
+import weakref
 
 class Literal(object):
-    """Literal object in a conjunctive normal form proposition. Represents the basic unit of a 
+    """Literal object in a conjunctive normal form proposition. Represents the basic unit of a
     proposition: a variable and its state.
-    
+
+    Literals are interned flyweights: there is only ever one Literal per variable and sign, so
+    Literal('a') always returns the same object while it is in use, and NOT() returns the one
+    Literal of the opposite sign, cached on the instance. Literals are immutable; the truth value
+    of each variable is held in a central assignment store shared by both of its Literals, and
+    is dropped once no Literal of the variable is left. The store is a list indexed by variable
+    number, so setting or reading a status is a single index, and the value of a Literal is the
+    status of its variable XOR its sign.
+
+    Every variable is numbered the first time a Literal of it is made, and each Literal has an
+    int id derived from that number: twice the number, plus 1 if the Literal is negated. Sorting
+    Literals by id groups the two Literals of a variable together, positive first.
+
     Attributes:
         variable: a name representing the literal
         sign: represents if the literal is negated (- for negated, + for not negated)
-        internal_status: boolean value representing the internal state of the literal
-        external_status: boolean value representing the external state of the literal"""
-    
-    def __init__(self, variable: str):
+        negation: the Literal of the same variable and the opposite sign; a weak reference from
+        the positive Literal, a strong one from the negated Literal
+        id: the int id of the Literal, also used as its hash value
+
+    Class attributes:
+        pool: a weak dict from each variable to its positive Literal
+        var_ids: a dict from each variable ever used to its number
+        statuses: the central assignment store, a list indexed by variable number holding the
+        internal status of the variable, None if it has none
+        version: the number of changes made to the assignment store
+    """
+    __slots__ = ('__variable', '__sign', '__negation', '__id', '__weakref__')
+    __pool = weakref.WeakValueDictionary()
+    __var_ids = {}
+    __statuses = [None] # index 0 is unused so variable numbers index directly
+    __version = 0
+
+    def __new__(cls, variable: str) -> 'Literal':
         """ Constructor method for a Literal object.
         args:
                 variable: a name representing the literal
         It is recommended to use the same name for the Literal as its variable.
 
+        Returns: the positive Literal of variable, the existing one if there is one
+
         Examples:
         >>> a = Literal('a')
-        >>> lit1 = Literal('lit1')"""
+        >>> lit1 = Literal('lit1')
+        >>> a is Literal('a')
+        True"""
 
         if not isinstance(variable, str):
             raise TypeError("Literal object only excepts a string as an argument.")
-        self.__variable = variable
-        self.__sign = "+"
-        self.__internal_status = None
-        self.__external_status = None # calculated based on sign and status
+        lit = Literal.__pool.get(variable)
+        if lit is None:
+            var_id = Literal.__var_ids.setdefault(variable, len(Literal.__var_ids) + 1)
+            if var_id == len(Literal.__statuses):
+                Literal.__statuses.append(None)
+            lit = Literal.__pool[variable] = Literal.__make(variable, '+', None, 2 * var_id)
+        return lit
+
+    @staticmethod
+    def __make(variable: str, sign: str, negation: 'Literal', lit_id: int) -> 'Literal':
+        """Returns: a new Literal of variable with sign and id lit_id, holding its negation if it
+        is negated"""
+        lit = object.__new__(Literal)
+        object.__setattr__(lit, '_Literal__variable', variable)
+        object.__setattr__(lit, '_Literal__sign', sign)
+        object.__setattr__(lit, '_Literal__negation', negation)
+        object.__setattr__(lit, '_Literal__id', lit_id)
+        return lit
+
+    def __setattr__(self, name, value):
+        """Raises: AttributeError, Literals are immutable"""
+        raise AttributeError("Literal objects are immutable.")
+
+    def __del__(self):
+        """Drops the status of the variable from the assignment store once its positive Literal,
+        which every negated Literal keeps alive, is no longer in use"""
+        if self.__sign == '+':
+            cls = type(self)
+            var_id = self.__id >> 1
+            if cls.__statuses[var_id] is not None:
+                cls.__statuses[var_id] = None
+                cls.__version += 1
 
     def __str__(self) -> str:
         """Returns: string representation of the Literal variable and its sign
-        
+
         Examples:
         >>> a = Literal('a')
         >>> str(a)
@@ -38,7 +96,7 @@ class Literal(object):
         '+a'
         """
         return self.__sign + self.__variable
-    
+
     def __repr__(self):
         """Returns: string representation of the Literal variable and its sign
 
@@ -48,10 +106,10 @@ class Literal(object):
         '+a'
         """
         return self.__sign + self.__variable
-    
+
     def NOT(self) -> 'Literal':
-        """Negates the Literal, flips the sign, changes external_status if the
-        Literal has an internal_status that is not None.
+        """Negates the Literal, returning the Literal with the opposite sign. Its external status
+        is the opposite of this one's when the variable has an internal status.
 
         given a Literal '+a':
         ~(a) == ~a => NOT(a) == -a
@@ -64,16 +122,20 @@ class Literal(object):
         >>> a2 = a.NOT()
         >>> print(a2)
         '-a'
+        >>> a2.NOT() is a
+        True
         """
-        lit_cp = copy.copy(self)
-        lit_cp.__flip_sign()
-        if lit_cp.get_internal_status is not None:
-            lit_cp.__set_external_status()
-        return lit_cp
-    
+        if self.__sign == '-':
+            return self.__negation
+        negation = self.__negation() if self.__negation is not None else None
+        if negation is None:
+            negation = Literal.__make(self.__variable, '-', self, self.__id + 1)
+            object.__setattr__(self, '_Literal__negation', weakref.ref(negation))
+        return negation
+
     def get_variable(self) -> str:
         """Returns: string representation of the Literal variable
-        
+
         Examples:
         >>> a = Literal('a')
         >>> a.get_variable()
@@ -84,19 +146,21 @@ class Literal(object):
         'lit1'
         """
         return self.__variable
-    
-    def __flip_sign(self):
-        """Makes the sign of the Literal the opposite of what it is set to before being called.
-        
-        i.e.
-          if the Literal sign is '+', it will flip to '-'
-          if the Literal sign is '-', it will flip to '+'
-          """
-        self.__sign = '-' if self.__sign == '+' else '+'
-    
+
+    def get_id(self) -> int:
+        """Returns: the int id of the Literal, twice the number of its variable, plus 1 if it is
+        negated
+
+        Examples:
+        >>> a = Literal('a')
+        >>> a.get_id() + 1 == a.NOT().get_id()
+        True
+        """
+        return self.__id
+
     def get_sign(self) -> str:
         """Returns: string representation of the Literal sign
-        
+
         Examples:
         >>> a = Literal('a')
         >>> a.get_sign()
@@ -107,92 +171,76 @@ class Literal(object):
         'neg'
         """
         return 'pos' if self.__sign == '+' else 'neg'
-    
+
     def set_internal_status(self, val=True):
-        """Sets the status of the Literal to val, sets external_status
-        
+        """Sets the status of the Literal variable to val in the assignment store, for both of
+        its Literals
+
         args:
             val: boolean to set the Literal status to; default is True
-            
+
         Examples:
         >>> a = Literal('a')
         >>> a.set_internal_status()
-        >>> a.__internal_status == True
+        >>> a.get_internal_status()
         True
-        
+
         >>> a.set_internal_status(False)
-        >>> a.__internal_status == False
-        True
+        >>> a.NOT().get_internal_status()
+        False
         """
         if not isinstance(val, bool):
             raise TypeError("set_internal_status only accepts bool type.")
-        self.__internal_status = val
-        self.__set_external_status()
+        Literal.__statuses[self.__id >> 1] = val
+        Literal.__version += 1
+
+    @staticmethod
+    def get_assignment_version() -> int:
+        """Returns: the version of the assignment store, which changes every time a status is 
+        set or dropped, so anything computed from the statuses can tell if it is out of date"""
+        return Literal.__version
 
     def get_internal_status(self) -> bool:
-        """Returns: the boolean value assigned to the Literal internal_status attribute
-        
+        """Returns: the boolean value assigned to the Literal variable in the assignment store,
+        None if it has none
+
         Examples:
         >>> a = Literal('a')
         >>> a.set_internal_status()
         >>> a.get_internal_status()
         True
-        
+
         >>> b = Literal('b')
         >>> b.set_internal_status(False)
         >>> b.get_internal_status()
         False
         """
-        return self.__internal_status
-    
-    def __set_external_status(self):
-        """Sets external_status of the Literal based on its sign and status attributes
-        
-        Examples:
-        >>> a = Literal('a')
-        >>> a.set_internal_status()
-        >>> a.get_sign()
-        'pos'
-        >>> a.__set_external_status()
-        >>> a.__external_status == True
-        True
-        
-        >>> a2 = a.NOT()
-        >>> a2.___set_external_status()
-        >>> a.__external_status == False
-        True
-        """
-        if self.__internal_status is None:
-            pass
-        elif self.__internal_status == True:
-            self.__external_status = self.__sign == '+'
-        elif self.__internal_status == False:
-            self.__external_status = self.__sign == '-'
-
-    
+        return Literal.__statuses[self.__id >> 1]
+
     def get_external_status(self) -> bool:
-        """Returns: the boolean value of the Literal external_status attribute
-        
+        """Returns: the boolean value of the Literal based on its sign and the status of its
+        variable, None if the variable has no status
+
         Examples:
         >>> a = Literal('a')
         >>> a.set_internal_status()
-        >>> a.get_sign()
-        'pos'
-        >>> a.__set_external_status()
         >>> a.get_external_status()
         True
-        
+
         >>> a2 = a.NOT()
-        >>> a2.___set_external_status()
-        >>> a.get_external_status()
+        >>> a2.get_external_status()
         False
         """
-        return self.__external_status
-    
+        status = Literal.__statuses[self.__id >> 1]
+        if status is None:
+            return None
+        # the low bit of the id is 1 for a negated Literal
+        return status != (self.__id & 1)
+
     def __eq__(self, other: 'Literal',) -> bool:
-        """Returns: a boolean representing if the variables of two Literals are
-        the same
-        
+        """Returns: a boolean representing if the variables and signs of two Literals are the
+        same, which for interned Literals means they are the same object
+
         Examples:
         >>> a = Literal('a')
         >>> a2 = Literal('a')
@@ -203,74 +251,50 @@ class Literal(object):
         >>> a == b
         False
         """
-        if not isinstance(other, Literal):
-            return False
-        same = True
-        same = False if self.get_variable() != other.get_variable() else same
-        same = False if self.get_sign() != other.get_sign() else same
-        same = False if self.get_internal_status() != other.get_internal_status() else same
-        return same
+        return self is other
 
     def __hash__(self) -> int:
-        """Returns: hash value of the Literal based on the variable attribute
-        
+        """Returns: hash value of the Literal, its id
+
         Used to place Literals in hashtables such as sets and dicts.
         """
-        return hash(self.__sign + self.__variable)
-    
+        return self.__id
+
     def __copy__(self) -> 'Literal':
-        """Performs a shallow copy of the Literal and its attributes.
-        Returns: a shallow copy of the Literal
-        
+        """Literals are immutable and interned, so a copy is the Literal itself
+        Returns: self
+
         Example:
         >>> a = Literal('a')
-        >>> a2 = copy.copy(a)
-        >>> a.get_variable() == a2.get_variable()
-        True
-        >>> a.get_sign() == a2.get_sign()
-        True
-        >>> a.get_internal_status() == a2.get_internal_status()
-        True
-        >>> a.get_external_status() == a2.get_external_status()
+        >>> copy.copy(a) is a
         True
         """
-        cp = Literal(self.__variable)
-        cp.__sign = self.__sign
-        cp.__internal_status = self.__internal_status
-        cp.__external_status = self.__external_status
-        return cp
+        return self
 
     def __deepcopy__(self, memo) -> 'Literal':
-        """performs a deep copy of the Literal and its attributes
-        since the attributes are all immutable, it is the same as a shallow copy
-        Returns: a deep copy of the Literal
-        
+        """Literals are immutable and interned, so a deep copy is the Literal itself
+        Returns: self
+
         Example:
         >>> a = Literal('a')
-        >>> a2 = copy.copy(a)
-        >>> a.get_variable() == a2.get_variable()
-        True
-        >>> a.get_sign() == a2.get_sign()
-        True
-        >>> a.get_internal_status() == a2.get_internal_status()
-        True
-        >>> a.get_external_status() == a2.get_external_status()
+        >>> copy.deepcopy(a) is a
         True
         """
-        cp = Literal(self.__variable)
-        memo[id(self)] = cp
-        cp.__sign = self.__sign
-        cp.__internal_status = self.get_internal_status()
-        cp.__external_status = self.get_external_status()
-        return cp
-    
+        return self
+
+    def __reduce__(self):
+        """Returns: how to rebuild the Literal when unpickled, through the pool"""
+        if self.__sign == '+':
+            return (Literal, (self.__variable,))
+        return (Literal.NOT, (self.__negation,))
+
     def __bool__(self):
         """Returns boolean representation of the Literal internal_status attribute
-        
+
         Example:
         >>> a = Literal('a')
         >>> a.set_internal_status()
         >>> bool(a)
         True
         """
-        return True if self.__internal_status else False
\ No newline at end of file
+        return True if Literal.__statuses[self.__id >> 1] else False
@@ -9,7 +9,7 @@ from dpll import DPLL
 
 def main():
     
-    dpll = DPLL()
+    dpll = DPLL(cdcl=True)
 
     # Every square has at least one value, v . A Literal variable for the Sudoku puzzle
     # represents a square on the board x_row_column_value 
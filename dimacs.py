@@ -0,0 +1,199 @@
+"""Author: Luke Marshall
+
+This module contains functions for reading propositions in the DIMACS CNF format straight into
+lists of signed int literals, without building any Literal or Clause objects, and for writing
+them back out, along with a sidecar file mapping the int variable ids to their names"""
+from typing import IO, Iterable, Iterator, Union
+import json
+import mmap
+import os
+
+CHUNK_SIZE = 1 << 20 # bytes read from the file at a time
+
+
+def read_dimacs(source: Union[str, os.PathLike, IO], chunk_size: int = CHUNK_SIZE,
+                use_mmap: bool = False) -> tuple[int, list[list[int]]]:
+    """Reads a proposition in DIMACS CNF format. The file is streamed in chunks of chunk_size
+    bytes; each chunk is split into int literals in one pass and cut into clauses at every 0,
+    so no per-literal objects are created. Comment lines ('c ...') are skipped, the problem line
+    ('p cnf <variables> <clauses>') gives the number of variables, and a '%' line ends the
+    proposition, as in the SATLIB benchmark files.
+
+    args:
+        source: a path to the file, or a file object opened in binary or text mode
+        chunk_size: the number of bytes to read at a time
+        use_mmap: if the file should be memory mapped instead of read, only used when source
+        is a path or a file object backed by a real file
+
+    Returns: the number of variables, the larger of the problem line count and the largest
+    variable used, and the list of clauses, each a list of signed int literals
+
+    Raises:
+        ValueError if the problem line is malformed or a token is not an int
+
+    Example:
+    >>> import io
+    >>> read_dimacs(io.BytesIO(b"c example\\np cnf 3 2\\n1 -2 0\\n2 3 0\\n"))
+    (3, [[1, -2], [2, 3]])
+    """
+    num_vars = 0
+    max_var = 0
+    clauses = []
+    pending = [] # literals of a clause split across chunks
+    for body in _bodies(_chunks(source, chunk_size, use_mmap)):
+        if isinstance(body, int):
+            num_vars = max(num_vars, body)
+            continue
+        lits = list(map(int, body.split()))
+        if not lits:
+            continue
+        max_var = max(max_var, max(lits), -min(lits))
+        if pending:
+            lits = pending + lits
+        start = 0
+        while True:
+            try:
+                end = lits.index(0, start)
+            except ValueError:
+                break
+            clauses.append(lits[start:end])
+            start = end + 1
+        pending = lits[start:]
+    if pending:
+        # the last clause is allowed to leave off its terminating 0
+        clauses.append(pending)
+    return max(num_vars, max_var), clauses
+
+
+def write_dimacs(dest: Union[str, os.PathLike, IO], num_vars: int,
+                 clauses: Iterable[Iterable[int]], comments: Iterable[str] = ()):
+    """Writes a proposition in DIMACS CNF format
+
+    args:
+        dest: a path to the file, or a file object opened in text mode
+        num_vars: the number of variables, given on the problem line
+        clauses: the clauses, each an iterable of signed int literals
+        comments: lines to write as comments before the problem line
+
+    Example:
+    >>> import io
+    >>> out = io.StringIO()
+    >>> write_dimacs(out, 3, [[1, -2], [2, 3]])
+    >>> out.getvalue()
+    'p cnf 3 2\\n1 -2 0\\n2 3 0\\n'
+    """
+    if isinstance(dest, (str, os.PathLike)):
+        with open(dest, 'w') as file:
+            write_dimacs(file, num_vars, clauses, comments)
+        return
+    lines = [' '.join(map(str, clause)) + ' 0\n' for clause in clauses]
+    for comment in comments:
+        dest.write(f"c {comment}\n")
+    dest.write(f"p cnf {num_vars} {len(lines)}\n")
+    dest.writelines(lines)
+
+
+def write_names(dest: Union[str, os.PathLike, IO], names: list[Union[str, None]]):
+    """Writes the sidecar file for a DIMACS file: a JSON list holding the name of each variable, 
+    the name of variable id i at index i - 1, or null for an id that has no name
+
+    args:
+        dest: a path to the file, or a file object opened in text mode
+        names: the variable names in id order
+    """
+    if isinstance(dest, (str, os.PathLike)):
+        with open(dest, 'w') as file:
+            write_names(file, names)
+        return
+    json.dump(names, dest)
+
+
+def read_names(source: Union[str, os.PathLike, IO]) -> list[Union[str, None]]:
+    """Reads a sidecar file written by write_names()
+
+    Returns: the variable names in id order, None for the ids without one
+
+    Raises:
+        ValueError if the file does not hold a JSON list of strings and nulls
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source) as file:
+            return read_names(file)
+    names = json.load(source)
+    if not isinstance(names, list) or \
+            not all(name is None or isinstance(name, str) for name in names):
+        raise ValueError("A DIMACS names file must hold a JSON list of strings and nulls.")
+    return names
+
+
+def _bodies(chunks: Iterator[bytes]) -> Iterator[Union[bytes, int]]:
+    """Splits the chunks of a DIMACS file into runs of complete lines holding only literals.
+    Comment lines are dropped, a problem line is replaced by its variable count, and a '%' line
+    stops the iteration.
+
+    Returns: an iterator of bytes holding literals, and ints holding problem line variable counts"""
+    rest = b''
+    for chunk in chunks:
+        chunk = rest + chunk
+        cut = chunk.rfind(b'\n') + 1
+        rest = chunk[cut:]
+        chunk = chunk[:cut]
+        if not chunk:
+            continue
+        if b'c' not in chunk and b'p' not in chunk and b'%' not in chunk:
+            # the common case: a chunk of nothing but literals
+            yield chunk
+            continue
+        lines = []
+        for line in chunk.split(b'\n'):
+            head = line.lstrip()[:1]
+            if head == b'c':
+                continue
+            if head == b'p' or head == b'%':
+                if lines:
+                    yield b'\n'.join(lines)
+                    lines = []
+                if head == b'%':
+                    return
+                yield _problem_vars(line)
+                continue
+            lines.append(line)
+        if lines:
+            yield b'\n'.join(lines)
+    head = rest.lstrip()[:1]
+    if head == b'p':
+        yield _problem_vars(rest)
+    elif head not in (b'c', b'%'):
+        yield rest
+
+
+def _problem_vars(line: bytes) -> int:
+    """Returns: the number of variables given by a 'p cnf <variables> <clauses>' problem line
+
+    Raises:
+        ValueError if line is not a cnf problem line"""
+    fields = line.split()
+    if len(fields) != 4 or fields[1] != b'cnf':
+        raise ValueError(f"Malformed DIMACS problem line: {line.decode(errors='replace')}")
+    return int(fields[2])
+
+
+def _chunks(source: Union[str, os.PathLike, IO], chunk_size: int,
+            use_mmap: bool) -> Iterator[bytes]:
+    """Returns: an iterator over the contents of source as bytes, chunk_size bytes at a time"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as file:
+            yield from _chunks(file, chunk_size, use_mmap)
+        return
+    if use_mmap:
+        try:
+            fileno = source.fileno()
+        except (AttributeError, OSError):
+            fileno = None # not backed by a real file, read it instead
+        if fileno is not None and os.fstat(fileno).st_size:
+            with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+                for start in range(0, len(mapped), chunk_size):
+                    yield mapped[start:start + chunk_size]
+            return
+    while chunk := source.read(chunk_size):
+        yield chunk.encode() if isinstance(chunk, str) else chunk
@@ -3,10 +3,13 @@
 Luke Marshall
 DPLL solver object
 """
-from typing import Union, Iterator
+from typing import IO, Union, Iterator, Iterable
 from Literal import Literal
 from Clause import Clause
+from solver import Solver
+from dimacs import read_dimacs, write_dimacs, read_names, write_names
 import copy
+import os
 
 class DPLL(object):
     """DPLL object contains a proposition in conjunctive normal form and uses a DPLL algorithm 
@@ -17,29 +20,52 @@ class DPLL(object):
     Properties:
         UNSAT: returned when the proposition is unsatisfiable
         SAT: returned when the propostion is satisfiable
-        CHANGED: returned when the unit_clause_heuristic changes the proposition
-        UNCHANGED: returned when the unit_clause_heuristic changes the proposition
         
     Attributes:
         variables: a dict of all the variables in every Literal in the proposition and their 
         corresponding boolean values; initialized to None, and finalized to their necessary 
         values for the proposition to be solved if it is satisfiable
-        proposition: a list of Literal and/or Clause objects
-        original: the original proposition before any dpll disregards or clause removals occur,
-        used to replace the propostion after dpll algorithm takes place
+        proposition: a list of Literal and/or Clause objects, holding None in the place of each
+        removed item until the list is next read, so removing an item does not shift the others
+        positions: a dict from the id of each Literal and Clause object in the proposition to 
+        the list of its positions, counting the clauses not yet decoded first; keyed by identity
+        since adding to a Clause changes its hash
+        removed: the number of removed items and clauses still held as None
+        var_ids: a dict interning each variable to the dense int id used for it by the Solver core
+        var_names: a list indexed by int id holding the variable it was interned from, None for
+        the ids taken by the activation variables of the solver scopes
+        clauses: a list of clauses, each a list of signed int literals, loaded without building 
+        Literal or Clause objects; they are decoded into the proposition only when it is accessed
+        cdcl: a boolean representing if the Solver core runs in conflict-driven clause learning mode
+        restarts: the restart policy the Solver core uses in CDCL mode
+        preprocess: a boolean representing if the Solver core preprocesses the clauses
+        solver: the Solver core the proposition is compiled to, kept between solves so that what 
+        it learns is reused; None until the first solve
+        synced: the number of clauses, the int clauses followed by the proposition, already 
+        added to the solver
+        scopes: for every scope opened by push(), the number of clauses in the int clauses and the
+        proposition together when it was opened
     """
     
     # Properties:
     UNSAT = 'unsat'
     SAT = 'sat'
-    CHANGED = True
-    UNCHANGED = False
 
-    def __init__(self, *args: Union[Literal, Clause, set[Literal]]):
+    def __init__(self, *args: Union[Literal, Clause, set[Literal]], cdcl: bool = False, 
+                 restarts: Union[str, None] = Solver.LUBY, preprocess: bool = False):
         """Constructor function produces the proposition for the DPLL by appropriately
         adding the Literals and Clauses to the proposition attribute. Also produces the 
         variables attribute dict by adding each Literal variable as a key and initializing its 
         value to None.
+
+        args:
+            *args: the Literals, Clauses, and negated Clauses making up the proposition
+            cdcl: if the search should learn clauses from conflicts and backjump instead of 
+            backtracking to the most recent guess
+            restarts: the restart policy used in CDCL mode, 'luby', 'geometric', 'glucose', or 
+            None to never restart
+            preprocess: if the clauses should be preprocessed before the search; the values of 
+            the variables preprocessing removes are still found by solve_for_variables()
         
         Raises:
             TypeError if the object being added does not meet criteria
@@ -55,9 +81,19 @@ class DPLL(object):
         """
         
         self.__variables = {}
+        self.__var_ids = {}
+        self.__var_names = [None] # index 0 is unused so int ids index directly
+        self.__clauses = []
+        self.__cdcl = cdcl
+        self.__restarts = restarts
+        self.__preprocess = preprocess
         self.__proposition = []
-        self.__original = []
+        self.__positions = {}
+        self.__removed = 0
         self.__initial_conditions = {}
+        self.__solver = None
+        self.__synced = 0
+        self.__scopes = []
         for item in args: 
             if isinstance(item, set):
                 # a negated clause produces a set of negated Literals that must individually 
@@ -66,18 +102,17 @@ class DPLL(object):
                     if not isinstance(lit, Literal):
                         raise TypeError("""DPLL proposition can only be made up of 
                                         Literal and Clause objects.""")
-                    self.__variables[lit.get_variable()] = None
-                    self.__proposition.append(lit)
+                    self.__intern(lit.get_variable())
+                    self.__append(lit)
             elif isinstance(item, Literal):
-                    self.__proposition.append(item)
-                    self.__variables[item.get_variable()] = None
+                    self.__append(item)
+                    self.__intern(item.get_variable())
             elif isinstance(item, Clause):
-                self.__proposition.append(item)
+                self.__append(item)
                 for lit in item:
-                    self.__variables[lit.get_variable()] = None
+                    self.__intern(lit.get_variable())
             else:
                 raise TypeError("A DPLL object only accepts Literal and Clause objects in the proposition.")
-        self.__original = copy.deepcopy(self.__proposition)
             
     def __str__(self) -> str:
         """Returns: a string representation of the proposition
@@ -93,6 +128,8 @@ class DPLL(object):
         >>> print(dpll)
         "['+c', "['+a', '+b']"]"
         """
+        self.__materialize()
+        self.__compact()
         return f"{[str(cl) for cl in self.__proposition]}"
     
     def __repr__(self) -> str:
@@ -107,6 +144,8 @@ class DPLL(object):
         >>> repr(dpll)
         "['+c', "['+a', '+b']"]"
         """
+        self.__materialize()
+        self.__compact()
         return f"{[repr(cl) for cl in self.__proposition]}"
     
     def get_proposition(self):
@@ -121,6 +160,8 @@ class DPLL(object):
         >>> dpll.get_proposition()
         ['+c', "['+a', '+b']"]
         """
+        self.__materialize()
+        self.__compact()
         return self.__proposition
     
     def get_variables(self) -> dict[str, Union[bool, None]]:
@@ -161,41 +202,32 @@ class DPLL(object):
                 if not isinstance(lit, Literal):
                     raise TypeError("""DPLL proposition can only be made up of 
                                     Literal and Clause objects.""")
-                if (lit_var := lit.get_variable()) not in self.__variables:
-                    self.__variables[lit_var] = None
-                if lit_var in self.__initial_conditions:
-                    lit.set_internal_status(self.__initial_conditions[lit_var])
-                self.__proposition.append(lit)
-                self.__original.append(copy.deepcopy(lit))
+                self.__intern(lit.get_variable())
+                self.__append(lit)
         elif isinstance(item, Literal):
             # Literals may be added directly, to proposition and variables
-            if (item_var := item.get_variable()) not in self.__variables:
-                self.__variables[item_var] = None
-            if item_var in self.__initial_conditions:
-                item.set_internal_status(self.__initial_conditions[item_var])
-            self.__proposition.append(item)
-            self.__original.append(copy.deepcopy(item))
+            self.__intern(item.get_variable())
+            self.__append(item)
         elif isinstance(item, Clause):
             # Clauses may be added directly, but the Literals they contains must be added to the 
             # variables dict individually
             if item.is_empty():
                 return
             for lit in item:
-                if (lit_var := lit.get_variable()) not in self.__variables:
-                    self.__variables[lit_var] = None
-                if lit_var in self.__initial_conditions:
-                    lit.set_internal_status(self.__initial_conditions[lit_var])
-            self.__proposition.append(item) # add the clause directly to the proposition
-            self.__original.append(copy.deepcopy(item))
+                self.__intern(lit.get_variable())
+            self.__append(item) # add the clause directly to the proposition
         else:
             raise TypeError("DPLL proposition can only be made up of Literal and Clause objects.")
         
     def __disregard(self, item: Union[Literal, Clause]):
         """Removes item from the proposition if it contains item
         Different than a pure removal because it does not attempt to remove the variable(s) in 
-        the disregarded Literal(s) from the variables attribute or the Clauses or Literals from 
-        the original attribute. If given a Literal, the method will look for a unit clause, it 
-        will not find it within a Clause. 
+        the disregarded Literal(s) from the variables attribute. If given a Literal, the method 
+        will look for a unit clause, it will not find it within a Clause. The item is found 
+        through the positions of its object and left as None in its place, so removing an item
+        held by the proposition takes constant time and does not decode the loaded int clauses.
+        The solver is dropped, since it may have learned clauses that depend on item, and is 
+        rebuilt on the next solve.
         
         Raises:
             TypeError if item is not a Literal or a Clause
@@ -216,8 +248,22 @@ class DPLL(object):
         
         if not isinstance(item, (Literal, Clause)):
             raise TypeError("A DPLL may only contain Literals or Clauses")
-        if item in self:
-            self.__proposition.remove(item)
+        pos = self.__find(item)
+        if pos is None:
+            return
+        loaded = len(self.__clauses)
+        if pos < loaded:
+            self.__clauses[pos] = None
+        else:
+            found = self.__proposition[pos - loaded]
+            positions = self.__positions[id(found)]
+            positions.remove(pos)
+            if not positions:
+                del self.__positions[id(found)]
+            self.__proposition[pos - loaded] = None
+        self.__removed += 1
+        self.__solver = None
+        self.__synced = 0
     
     def __contains__(self, item: Union[Literal, Clause]) -> bool:
         """Returns: a boolean representing if the proposition contains item
@@ -241,63 +287,141 @@ class DPLL(object):
         
         if not isinstance(item, (Literal, Clause)):
             raise TypeError("A DPLL may only contain Literals or Clauses")
-        return item in self.__proposition
+        return self.__find(item) is not None
     
     def __iter__(self) -> Iterator:
         """Returns: an iterator through the proposition attribute"""
+        self.__materialize()
+        self.__compact()
         return iter(self.__proposition)
     
     def __getitem__(self, index: int) -> Union[Literal, Clause]:
         """Returns: the object in the proposition attribute of the DPLL at index"""
+        self.__materialize()
+        self.__compact()
         return self.__proposition[index]
     
     def is_empty(self) -> bool:
         """Returns: a boolean representing if the proposition is empty or not"""
-        return not len(self.__proposition)
+        return not len(self)
     
     def __len__(self):
-        """Returns: the length of the proposition list"""
-        return len(self.__proposition)
+        """Returns: the length of the proposition list, counting clauses not yet decoded"""
+        return len(self.__proposition) + len(self.__clauses) - self.__removed
     
     def __copy__(self) -> 'DPLL':
         """Implements a shallow copy of the DPLL
         Returns: a shallow copy of the DPLL"""
-        cp = DPLL()
+        cp = DPLL(cdcl=self.__cdcl, restarts=self.__restarts, preprocess=self.__preprocess)
+        self.__compact()
         cp.__proposition = self.__proposition.copy()
+        cp.__positions = {key: positions.copy() for key, positions in self.__positions.items()}
         cp.__variables = self.__variables.copy()
+        cp.__var_ids = self.__var_ids.copy()
+        cp.__var_names = self.__var_names.copy()
+        cp.__clauses = self.__clauses.copy()
+        cp.__scopes = self.__scopes.copy()
         return cp
     
     def __deepcopy__(self, memo) -> 'DPLL':
         """Implements a deep copy of the DPLL
         Returns: a deep copy of the DPLL"""
-        cp = DPLL()
+        cp = DPLL(cdcl=self.__cdcl, restarts=self.__restarts, preprocess=self.__preprocess)
         memo[id(self)] = cp
-        cp.__proposition = [copy.deepcopy(item, memo) for item in self.__proposition]        
+        self.__compact()
+        cp.__proposition = [copy.deepcopy(item, memo) for item in self.__proposition]
         cp.__variables = copy.deepcopy(self.__variables, memo)
+        cp.__var_ids = self.__var_ids.copy()
+        cp.__var_names = self.__var_names.copy()
+        cp.__clauses = [clause.copy() for clause in self.__clauses]
+        cp.__scopes = self.__scopes.copy()
+        cp.__reindex()
         return cp
     
+    def push(self):
+        """Opens a scope: the Literals and Clauses added until the matching pop() are removed 
+        from the proposition by it, along with everything the solver learned from them. Scopes 
+        may be nested. The variables added in a scope stay in the variables attribute.
+
+        Example:
+        >>> a = Literal('a')
+        >>> b = Literal('b')
+        >>> dpll = DPLL(Clause(a, b))
+        >>> dpll.push()
+        >>> dpll.ADD(a.NOT())
+        >>> dpll.ADD(b.NOT())
+        >>> dpll.solve()
+        'unsat'
+        >>> dpll.pop()
+        >>> dpll.solve()
+        'sat'
+        """
+        self.__scopes.append(len(self.__clauses) + len(self.__proposition))
+
+    def pop(self):
+        """Closes the innermost scope opened by push(), removing the Literals and Clauses added
+        since from the proposition
+
+        Raises:
+            ValueError if there is no open scope
+        """
+        if not self.__scopes:
+            raise ValueError("There is no open scope to pop.")
+        start = self.__scopes.pop()
+        if self.__solver is not None and len(self.__solver.get_scopes()) > len(self.__scopes):
+            self.__solver.pop()
+        self.__synced = min(self.__synced, start)
+        # the int clauses are only loaded on construction, so the scope starts after them
+        cut = start - len(self.__clauses)
+        for pos, item in enumerate(self.__proposition[cut:], start):
+            if item is None:
+                self.__removed -= 1
+                continue
+            positions = self.__positions[id(item)]
+            positions.remove(pos)
+            if not positions:
+                del self.__positions[id(item)]
+        del self.__proposition[cut:]
+
     def set_initial_conditions(self, **kwargs: dict[str: bool]) -> dict[str: bool]:
-        """sets the initial conditions for the variables in the proposition"""
+        """sets the initial conditions for the variables in the proposition; they are passed to 
+        the solver as assumptions on every solve, so the Literals in the proposition are left as
+        they are"""
         self.__initial_conditions = kwargs
         # set variables attribute according to the initial conditions
         for var in self.__initial_conditions:
             if var in self.__variables:
                 self.__variables[var] = self.__initial_conditions[var]
-        # set the internal status of Literals according to the initial conditions
-        for cl in self:
-            if isinstance(cl, Literal):
-                if (lit_var := cl.get_variable()) in self.__initial_conditions:
-                    cl.set_internal_status(self.__initial_conditions[lit_var])
-            elif isinstance(cl, Clause):
-                for lit in cl:
-                    if (lit_var := lit.get_variable()) in self.__initial_conditions:
-                        lit.set_internal_status(self.__initial_conditions[lit_var])
-            else:
-                raise TypeError("Only Clause and Literal objects allowed in a proposition.")
         return kwargs
     
-    def solve_for_variables(self) -> Union[dict, None]:
+    def solve(self, assumptions: Iterable[Literal] = ()) -> str:
+        """Finds if the proposition is satisfiable with every Literal in assumptions True, on top
+        of the initial conditions. The assumptions only hold for this call: the solver is kept 
+        between calls, along with the clauses it has learned and its branching heuristics, so 
+        asking many questions of one proposition does not rebuild it each time.
+
+        Returns: a string representing if the proposition is satisfiable or not
+                'sat' if satisfiable
+                'unsat' if not satisfiable under the assumptions
+
+        Example:
+        >>> a = Literal('a')
+        >>> b = Literal('b')
+        >>> dpll = DPLL(Clause(a, b))
+        >>> dpll.solve([a.NOT()])
+        'sat'
+        >>> dpll.solve([a.NOT(), b.NOT()])
+        'unsat'
+        >>> dpll.solve()
+        'sat'
+        """
+        return self.dpll(assumptions=assumptions)
+
+    def solve_for_variables(self, assumptions: Iterable[Literal] = ()) -> Union[dict, None]:
         """Uses the solver process to set the variable values in the variables attribute.
+
+        args:
+            assumptions: Literals taken as True for this call only, see solve()
         
         Returns: either None if the proposition is unsatisfiable, or the dict of variables
         and their boolean values used to satisfy the proposition
@@ -312,8 +436,7 @@ class DPLL(object):
         { 'c': True, 'a': True, 'b': 'either' }
         """
         
-        res = self.dpll(variable_tracking=True, guess_made=True if len(self.__initial_conditions) else False)
-        self.__proposition = copy.deepcopy(self.__original)
+        res = self.dpll(variable_tracking=True, assumptions=assumptions)
         if res == 'sat':
             vars = self.__variables.copy()
             for var in vars:
@@ -324,7 +447,7 @@ class DPLL(object):
             return None
         
     def solve_satisfiability(self) -> str:
-        """ replaces the resulting proposition with the original proposition after dpll method call
+        """ finds if the proposition is satisfiable, leaving the proposition unchanged
         
         Returns: a string representing if the proposition is satisfiable or not
                 'sat' if satisfiable
@@ -352,27 +475,32 @@ class DPLL(object):
         if self.__initial_conditions:
             raise AttributeError("Initial conditions attribute has values, need to use solve_for_variables()")
         res = self.dpll()
-        self.__proposition = copy.deepcopy(self.__original)
         self.__variables = {var : None for var in self.__variables}
         return res
     
-    def dpll(self, variable_tracking=False, guess_made=False) -> str:
-        """Implements the DPLL algorithm to find if the proposition is satisfiable or unsatisfiable
+    
+    def dpll(self, variable_tracking=False, assumptions: Iterable[Literal] = ()) -> str:
+        """Implements the DPLL algorithm to find if the proposition is satisfiable or unsatisfiable.
+        The proposition is compiled down to signed int literals and handed to the Solver core; the 
+        Literal and Clause objects in the proposition are not changed by the search. Only the 
+        items added since the last call are compiled, the Solver core is reused.
 
         args:
-            variable_tracking (bool): boolean representing if the dpll should be tracking the variable assignments
-            and check them with the original proposition
+            variable_tracking (bool): boolean representing if the dpll should copy the variable 
+            assignments found by the search into the variables attribute, once they have been
+            checked against the proposition
                 - set to True when the variables are being solved for
                 - set to False when only concern is satisfiability
-            guess_made (bool): boolean representing if the process that resulted in the calling of dpll() was a guess; used in
-            conjunction with variable_tracking to check when validating if current value assignments in the variables attribute
-            still allow 
-                - set to True if the process resulting in this call is a guess, or the first call after setting iniial conditions
-                - set to False if the process resulting in this call is any other 
+            assumptions: Literals taken as True for this call only, along with the initial 
+            conditions
         
         Returns: a string representing if the proposition is satisfiable or not
                 'sat' if satisfiable
                 'unsat' if not satisfiable
+
+        Raises:
+            RuntimeError if variable_tracking is set and the assignment found by the search does
+            not satisfy the proposition, which would be a bug in the Solver core
                 
         Example:
         >>> a = Literal('a')
@@ -382,264 +510,256 @@ class DPLL(object):
         >>> dpll = DPLL(c, cl)
         >>> dpll.dpll()
         'sat'
-        # proposition not the same before and after solving:
-        >>> dpll.get_proposition()
-        []
 
         >> dpll = DPLL(a, a.NOT())
         >>> dpll.dpll()
-        'unsat'
-        # proposition not the same before and after solving:
-        >>> dpll.get_proposition()
-        ['-a']"""
-        
-        if variable_tracking and guess_made:
-            if not self.check_assignments_with_original():
-                return DPLL.UNSAT
-
-        self.simplify()
-        # Base case: the proposition is True so it contains only True clauses, therefore the 
-        # proposition will eventually be empty if all True clauses are removed, but a check for 
-        # all True is also conducted in the search for unsatisfiability
-        if self.is_empty():
-            # an empty proposition is satisfiable
-            return DPLL.SAT
-        values = set()
-        for clause in self.__proposition:
-            if isinstance(clause, Literal):
-                values.add(clause.get_external_status())
-            elif isinstance(clause, Clause):
-                values.add(clause.get_status())
-        if (False in values):
-            # if any clause has the external value of False, the proposition is unsatisfiable
-            return DPLL.UNSAT
-        elif not (None in values) and (True in values): # if None in values and not False, 
-                                                        # then its satisfiability is still unknown, can pass by
-            # None and False already not in values, so only things in the proposition are clauses
-            # with the external value of True, ∴ the proposition is satisfiable
-            return DPLL.SAT
-        
-        # apply unit clause heristic until the proposition is either unsat or did not change with
-        # most recent call to UCH
-        res = self.unit_clause_heuristic()     
-        if res == DPLL.UNSAT:
-            return res
-        elif res == DPLL.CHANGED:
-            return self.dpll(variable_tracking)
-        
-        # apply pure clause heuristic until the proposition did not change with most recent call 
-        # to PCH
-        res2 = self.pure_clause_heuristic()
-        if res2:
-            return self.dpll(variable_tracking) 
-        
-        # apply guess and check:
-        prop_cp = copy.deepcopy(self.__proposition)
-        vars_cp = self.__variables.copy()
-        # apply guess on shortest Clause to have best chance at correct guess
-        guess_cl = min(self.__proposition, key=len)
-        guess = guess_cl[0]
-        guess_var = guess.get_variable()
-        guess_sign = guess.get_sign()
-        # assigns the guess value to the variable that makes the external value of the Literal True
-        # so at least one Clause may be removed from the proposition
-        self.__guess(guess_var, True if guess_sign == 'pos' else False)
-        self.simplify()
-        # check the guess:          
-        res3 = self.dpll(variable_tracking, guess_made=True)
-        if res3 == 'sat':
-            return res3
-        else:
-            self.__proposition = prop_cp
-            self.__variables = vars_cp
+        'unsat'"""
+        solver = self.__sync()
+        lits = [self.__var_ids[var] if val else -self.__var_ids[var] 
+                for var, val in self.__initial_conditions.items() if var in self.__var_ids]
+        for lit in assumptions:
+            # like the initial conditions, assumptions on variables not in the proposition are 
+            # left out
+            if lit.get_variable() in self.__var_ids:
+                lits.extend(self.__encode(lit))
+        res = solver.solve(lits)
+        if res == DPLL.SAT and variable_tracking:
+            model = solver.get_model()
+            if not self.__verify(model, lits):
+                raise RuntimeError("The assignment found does not satisfy the proposition.")
+            for var, var_id in self.__var_ids.items():
+                self.__variables[var] = model[var_id]
+        return res
 
-        # First guess was a failure, guess the opposite value:
-        self.__guess(guess_var, False if guess_sign == 'pos' else True)
-        self.simplify()
+    def __verify(self, model: list[Union[bool, None]], assumptions: list[int]) -> bool:
+        """Checks the assignment found by the search against the proposition as it was given, 
+        not the clauses the Solver core has simplified, in one pass: the literals the model makes
+        True are collected into sets, and every clause must share a literal with them
 
-        # Second guess is either True XOR the resulting failure means the proposition is unsatisfiable
-        return self.dpll(variable_tracking, guess_made=True)
-    
-    def __guess(self, var: str, val: bool):
-        """Applies a guess on the status of a variable, setting the internal status of every 
-        Literal with var as its variable to val"""
-        self.__variables[var] = val
-        for clause in self:
-            assert isinstance(clause, Clause), "Non_Clause found in proposition during guess."
-            for lit in clause:
-                if lit.get_variable() == var:
-                    lit.set_internal_status(val)
+        args:
+            model: the values of the variables indexed by int id, as returned by get_model()
+            assumptions: the int literals the search was given as assumptions
 
-    
-    def simplify(self):
-        """Simplifies the proposition by:
-        -- disregarding the Literals with an external status of True
-        -- removing Literals with an external status of False from inside Clauses
-        -- disregarding the Clauses with a status of True, or that are empty
-        -- substituting the Literal contained within a Clause of length 1 in for the Clause"""
-        to_disregard = []
-        for i, item in enumerate(self):
+        Returns: a boolean representing if model makes the assumptions and every Literal and
+        Clause in the proposition True"""
+        true_ids = {var_id if val else -var_id for var_id, val in enumerate(model) 
+                    if val is not None and var_id}
+        if not true_ids.issuperset(assumptions):
+            return False
+        if not all(clause is None or not true_ids.isdisjoint(clause) for clause in self.__clauses):
+            return False
+        true_lits = set()
+        for var, var_id in self.__var_ids.items():
+            if model[var_id] is not None:
+                lit = Literal(var)
+                true_lits.add(lit if model[var_id] else lit.NOT())
+        for item in self.__proposition:
             if isinstance(item, Literal):
-                if item.get_external_status():
-                    to_disregard.append(item)
-            elif isinstance(item, Clause):
-                if item.get_status():
-                    to_disregard.append(item)
-                    continue
-                elif len(item) == 1:
-                    to_disregard.append(item)
-                    self.ADD(item[0])
-                    continue
-                for lit in item:
-                    if lit.get_external_status() == False:
-                        self.__proposition[i] = item.remove(lit)
-            else:
-                raise TypeError("Proposition may only contain Literals and Clauses")
-        for item in to_disregard:
-            self.__disregard(item)
-    
-    def check_assignments_with_original(self) -> bool:
-        """Checks if the assignments made through unit_clause_hueristic, pur_clause_hueristic, and guessing are 
-        valid options for having a satisfiable original proposition
+                if item not in true_lits:
+                    return False
+            elif item is not None and true_lits.isdisjoint(item):
+                return False
+        return True
+
+    def __intern(self, var: str) -> int:
+        """Interns var to a dense int id, adding it to the variables attribute if it is new
         
-        Returns: a boolen representing if the original porposition is satisfiable (True) or not (False) given the current 
-        value assignments held in the variables attribute
+        Returns: the int id of var, ids start at 1 and follow the order the variables were added"""
+        if (var_id := self.__var_ids.get(var)) is None:
+            var_id = self.__var_ids[var] = len(self.__var_names)
+            self.__var_names.append(var)
+            self.__variables.setdefault(var, None)
+        return var_id
+
+    def __encode(self, item: Union[Literal, Clause]) -> list[int]:
+        """Returns: the Literal or Clause item as a list of signed int literals, +id for a 
+        Literal with a positive sign and -id for a negated one"""
+        lits = [item] if isinstance(item, Literal) else item
+        return [self.__intern(lit.get_variable()) if lit.get_sign() == 'pos' 
+                else -self.__intern(lit.get_variable()) for lit in lits]
+
+    def __decode(self, clause: list[int]) -> Union[Literal, Clause]:
+        """Returns: the int clause as a Literal if it has one literal, otherwise as a Clause"""
+        lits = []
+        for lit in clause:
+            lits.append(Literal(self.__var_names[abs(lit)]))
+            if lit < 0:
+                lits[-1] = lits[-1].NOT()
+        return lits[0] if len(lits) == 1 else Clause(*lits)
+
+    def __materialize(self):
+        """Decodes the clauses loaded as ints into Literals and Clauses at the front of the 
+        proposition, where they were loaded"""
+        if not self.__clauses:
+            return
+        decoded = [None if clause is None else self.__decode(clause) for clause in self.__clauses]
+        self.__proposition[:0] = decoded
+        self.__clauses = []
+        self.__reindex()
+
+    def __append(self, item: Union[Literal, Clause]):
+        """Appends item to the proposition, recording its position"""
+        pos = len(self.__clauses) + len(self.__proposition)
+        self.__positions.setdefault(id(item), []).append(pos)
+        self.__proposition.append(item)
+
+    def __reindex(self):
+        """Rebuilds the positions attribute from the proposition"""
+        self.__positions = {}
+        loaded = len(self.__clauses)
+        for pos, item in enumerate(self.__proposition, loaded):
+            if item is not None:
+                self.__positions.setdefault(id(item), []).append(pos)
+
+    def __find(self, item: Union[Literal, Clause]) -> Union[int, None]:
+        """Returns: the position of item in the proposition, counting the clauses not yet 
+        decoded first, None if it is not there. The object itself is found through the 
+        positions attribute; only an equal Clause that is another object, or a clause not yet 
+        decoded, is looked for by scanning. A Literal is the same object as the one a unit 
+        clause not yet decoded would become, so those come first, as they are first in order."""
+        positions = self.__positions.get(id(item))
+        if positions and (isinstance(item, Clause) or not self.__clauses):
+            return positions[0]
+        if self.__clauses:
+            var_ids = self.__var_ids
+            if all(lit.get_variable() in var_ids 
+                   for lit in ([item] if isinstance(item, Literal) else item)):
+                # compare the int clauses as they would be decoded, without decoding them
+                lits = set(self.__encode(item))
+                unit = isinstance(item, Literal)
+                for pos, clause in enumerate(self.__clauses):
+                    if clause is not None and (len(clause) == 1) == unit and set(clause) == lits:
+                        return pos
+        if positions:
+            return positions[0]
+        if isinstance(item, Clause):
+            for pos, other in enumerate(self.__proposition, len(self.__clauses)):
+                if isinstance(other, Clause) and other == item:
+                    return pos
+        return None
+
+    def __compact(self):
+        """Drops the removed items and clauses held as None, moving the scope starts to the new
+        positions; the cost is paid once for any number of removals"""
+        if not self.__removed:
+            return
+        live = [0] # live[i] is the number of items left in the first i positions
+        for item in self.__clauses + self.__proposition:
+            live.append(live[-1] + (item is not None))
+        self.__scopes = [live[start] for start in self.__scopes]
+        self.__synced = live[self.__synced]
+        self.__clauses = [clause for clause in self.__clauses if clause is not None]
+        self.__proposition = [item for item in self.__proposition if item is not None]
+        self.__removed = 0
+        self.__reindex()
+
+    @classmethod
+    def from_dimacs(cls, source: Union[str, os.PathLike, IO], use_mmap: bool = False, 
+                    names: Union[str, os.PathLike, IO, None] = None, **kwargs) -> 'DPLL':
+        """Loads a proposition in DIMACS CNF format. The file is streamed in chunks (or memory 
+        mapped) straight into the int clause store, without building any Literal or Clause 
+        objects. The variables are named from the names sidecar file written by to_dimacs() if 
+        one is given, otherwise by their DIMACS numbers as strings, '1', '2', ...
+
+        args:
+            source: a path to the file, or a file object opened in binary or text mode
+            use_mmap: if the file should be memory mapped instead of read in chunks
+            names: a path to, or file object of, the sidecar file naming the variables
+            **kwargs: the cdcl, restarts, and preprocess options of the DPLL constructor
+
+        Returns: a DPLL holding the proposition in the file
+
+        Raises:
+            ValueError if the file is not valid DIMACS CNF, or the names file does not name every
+            variable exactly once
+
+        Example:
+        >>> dpll = DPLL.from_dimacs('example.cnf', cdcl=True)
+        >>> dpll.solve_satisfiability()
+        'sat'
         """
-        checker = copy.deepcopy(self.__original)
-        for item in self.__original:
-            if isinstance(item, Literal):
-                print(item)
-        for item in checker:
-            if isinstance(item, Literal):
-                if (status := self.__variables[item.get_variable()]) is not None:
-                    item.set_internal_status(status)
-                    # print(checker)
-                    # print(item)
-                    # print(item.get_external_status())
-                    if item.get_external_status() == False:
-                        print("unsat in checker pt 1")
-                        return False # if the external status of a unit clause is false, the original proposition is not 
-                                    # satisfiable with the current value assignments in the variables attribute
-                
-            if isinstance(item, Clause):
-                for lit in item:
-                    if (status := self.__variables[lit.get_variable()]) is not None:
-                        lit.set_internal_status(status)
-                    if (lit.get_external_status()) == False:
-                        item.remove(lit)
-                        if not len(item):
-                            print("unsat from checker pt 2") # if all the literals in a clause are removed, the clause is False
-                            return False # and the original proposition is not satisfiable with the current 
-                                            # value assignments in the variables attribute
-        
-        # If no False clauses found in the proposition copy, then the proposition may still be satisfiable
-        return True
-                    
-
-    def unit_clause_heuristic(self) -> str:
-            '''Sets the value of any unit clauses so their external external status is True.
-            Checks the proposition for any sign contradictions on the unit clauses.
-            Removes the unit clauses. Removes literals from clauses if they have a negated sign
-            but the same variable as a unit clause; removes the clause from the proposition 
-            if the sign is the same.
-            
-            Returns: string representing if the proposition was changed in the process or if a 
-            contradiction was found, allowing the proposition to be labeled unsatisfiable
-            
-            Example:
-            proposition = ['+a', ['+a', '+b'], ['-a', '-b'], ['+c', '+d']]
-            after UHC call:
-            proposition = [-b, ['+c', '+d']]
-            after second UHC call:
-            proposition = [['+c', '+d']]
-            '''
-            print("applying UCH")
-            uclauses = {} # Literal variable (str) : Literal sign (str)
-            for item in self:
-                # finds all unit clauses and adds their attributes to uclauses, sets the status 
-                # of the Literal, checks there are no sign contradictions among the unit clauses
-                if isinstance(item, Literal):
-                    lit_sign = item.get_sign()
-                    if (lit_var := item.get_variable()) in uclauses:
-                        # if the Literal variable is in uclauses, checks the sign is the same as in
-                        # this Literal; if not, unsat by contradiction 
-                        if lit_sign != uclauses[lit_var]:
-                            return DPLL.UNSAT # by contradiction
-                    else:
-                        uclauses[lit_var] = lit_sign
-                        self.__variables[lit_var] = True if lit_sign == 'pos' else False
-                    item.set_internal_status(self.__variables[lit_var])
-
-            for clause in self:
-                # If the Literal variable is in uclauses, sets the status of the Literal 
-                # according to the variables attribute
-                if isinstance(clause, Clause):
-                    for lit in clause:
-                        if (lit_var := lit.get_variable()) in uclauses:
-                            lit.set_internal_status(self.__variables[lit_var])
-
-            if len(uclauses):
-                self.simplify()
-                return DPLL.CHANGED
-            
-            return DPLL.UNCHANGED
-
-    def pure_clause_heuristic(self) -> bool:
-        '''Sets the value of any pure clauses so that their external_status attributes are True. 
-        Removes all Caluses containig those Literals
-         
-         Returns: bool representing if the proposition was changed at all in the process
-
-         Example:
-        proposition = [['+a', '+b'], '+b', ['+b', '-c'], '+d', ['+b', '+d'], ['-d', '+c']]
-        after PHC call:
-        proposition = ['+d', ['-d', '+c']]
-         '''
-        print("applying PCH")
-        changed = False
-        # Literal variable (str) : Tuple(Literal sign (str), <---                            
-        var_signs_uniformity = {} # ---> bool representing the uniformity of the signs throughout)
-        for clause in self:
-            # Checks that a given variable has sign uniformity throughout the proposition,
-            # the status of this check is noted in var_signs_uniformity
-            if isinstance(clause, Clause):
-                for lit in clause:
-                    lit_var = lit.get_variable()
-                    lit_sign = lit.get_sign()
-                    if lit_var in var_signs_uniformity:
-                        if var_signs_uniformity[lit_var][0] != lit_sign:
-                            var_signs_uniformity[lit_var][1] = False
-                    else:
-                        var_signs_uniformity[lit_var] = [lit_sign, True]
-            elif isinstance(clause, Literal):
-                lit_var = lit.get_variable()
-                lit_sign = lit.get_sign()
-                if lit_var in var_signs_uniformity:
-                    if var_signs_uniformity[lit_var][0] != lit_sign:
-                        var_signs_uniformity[lit_var][1] = False
-                else:
-                    var_signs_uniformity[lit_var] = [lit_sign, True]
-
-        uniform_vars = set(var for var in var_signs_uniformity if var_signs_uniformity[var][1])
-        for item in self:
-            # Literals whose value in var_uniformity is True assigned a bool such that their 
-            # external values are True and the clauses containing them may be disregarded from 
-            # the proposition 
-            if isinstance(item, Literal):
-                if (lit_var := item.get_variable()) in uniform_vars:
-                    lit_sign = lit.get_sign()
-                    self.__variables[lit_var] = True if lit_sign == 'pos' else False
-                    lit.set_internal_status(self.__variables[lit_var])
-                    changed = True
-            elif isinstance(item, Clause):
-                for lit in item:
-                    if (lit_var := lit.get_variable()) in uniform_vars:
-                        lit_sign = lit.get_sign()
-                        self.__variables[lit_var] = True if lit_sign == 'pos' else False
-                        lit.set_internal_status(self.__variables[lit_var])
-                        changed = True
-        if changed: 
-            self.simplify()
-        return changed
+        num_vars, clauses = read_dimacs(source, use_mmap=use_mmap)
+        if names is None:
+            var_names = [str(var) for var in range(1, num_vars + 1)]
+        else:
+            var_names = read_names(names)
+            named = [var for var in var_names if var is not None]
+            if len(var_names) < num_vars or len(set(named)) != len(named):
+                raise ValueError("The names file must name every DIMACS variable exactly once.")
+        dpll = cls(**kwargs)
+        for var in var_names:
+            if var is None:
+                # the id of a scope activation variable, kept so the other ids line up
+                dpll.__var_names.append(None)
+            else:
+                dpll.__intern(var)
+        dpll.__clauses = clauses
+        return dpll
+
+    def to_dimacs(self, dest: Union[str, os.PathLike, IO], 
+                  names: Union[str, os.PathLike, IO, None] = None):
+        """Writes the proposition in DIMACS CNF format, every variable numbered by its int id, 
+        along with a sidecar file mapping the ids back to the variable names if names is given.
+        Passing both files to from_dimacs() rebuilds the proposition without running the code 
+        that built its Literals and Clauses. Initial conditions are not written.
+
+        args:
+            dest: a path to the DIMACS file, or a file object opened in text mode
+            names: a path to, or file object of, the sidecar names file
+
+        Example:
+        >>> a = Literal('a')
+        >>> b = Literal('b')
+        >>> dpll = DPLL(Clause(a, b.NOT()), b)
+        >>> dpll.to_dimacs('example.cnf', 'example.json')
+        >>> DPLL.from_dimacs('example.cnf', names='example.json').get_proposition()
+        ["['+a', '-b']", '+b']
+        """
+        clauses = [clause for clause in self.__clauses if clause is not None] + \
+            [self.__encode(item) for item in self.__proposition if item is not None]
+        write_dimacs(dest, len(self.__var_names) - 1, clauses)
+        if names is not None:
+            write_names(names, self.__var_names[1:])
+
+    def __sync(self) -> Solver:
+        """Compiles the items added to the proposition since the last call down to the Solver 
+        over int literals, creating the Solver on the first call. The int clauses come first and
+        are decoded to the front of the proposition, so the order of the two together is stable.
+        The solver scopes are opened as the items they start at are reached.
 
+        Returns: the solver attribute, holding one int clause per item in the proposition"""
+        if self.__solver is None:
+            if not self.__clauses and len(self.__var_names) - 1 > len(self.__var_ids):
+                # no int clause refers to the ids of the activation variables of an earlier 
+                # solver, so they are given up rather than kept beside those of the new one
+                self.__var_names = [var for var_id, var in enumerate(self.__var_names) 
+                                    if not var_id or var is not None]
+                self.__var_ids = {var: var_id for var_id, var in enumerate(self.__var_names) 
+                                  if var_id}
+            self.__solver = Solver(cdcl=self.__cdcl, restarts=self.__restarts, 
+                                   preprocess=self.__preprocess)
+            self.__synced = 0
+        solver = self.__solver
+        for _ in range(len(self.__var_names) - 1 - solver.get_num_vars()):
+            solver.new_var()
+        loaded = len(self.__clauses)
+        total = loaded + len(self.__proposition)
+        opened = solver.get_scopes()
+        for i in range(self.__synced, total):
+            while len(opened) < len(self.__scopes) and self.__scopes[len(opened)] <= i:
+                self.__push_solver()
+            item = self.__clauses[i] if i < loaded else self.__proposition[i - loaded]
+            if item is not None:
+                solver.add_clause(item if i < loaded else self.__encode(item))
+        while len(opened) < len(self.__scopes):
+            self.__push_solver()
+        self.__synced = total
+        return solver
 
+    def __push_solver(self):
+        """Opens a scope in the solver, reserving an id for its activation variable if the solver 
+        had to create a new one"""
+        num_vars = self.__solver.get_num_vars()
+        self.__solver.push()
+        if self.__solver.get_num_vars() > num_vars:
+            self.__var_names.append(None)
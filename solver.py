@@ -0,0 +1,1423 @@
+"""Author: Luke Marshall
+
+This module contains the definition of a Solver object, the integer-encoded search engine that
+the DPLL front-end compiles its Literals and Clauses down to"""
+from typing import Iterable, Union
+from collections import deque
+
+
+class VarOrder(object):
+    """VarOrder object is a binary max-heap of variable ids ordered by their activity, used by the
+    Solver to pick the unassigned variable with the highest activity to guess on next. The
+    position of every variable in the heap is indexed, so a variable can be found, moved up
+    after its activity increases, or removed in O(log n).
+
+    Attributes:
+        activity: a list indexed by variable id holding its activity, shared with the Solver
+        heap: the variable ids in heap order
+        indices: a list indexed by variable id holding its position in heap, -1 if not in it
+    """
+
+    def __init__(self, activity: list[float]):
+        """Constructor method for the VarOrder object
+
+        args:
+            activity: the list of variable activities to order by, index 0 is unused
+
+        Example:
+        >>> order = VarOrder([0.0, 1.0, 3.0, 2.0])
+        >>> for var in (1, 2, 3):
+        ...     order.insert(var)
+        >>> order.pop()
+        2
+        """
+        self.__activity = activity
+        self.__heap = []
+        self.__indices = [-1] * len(activity)
+
+    def __len__(self) -> int:
+        """Returns: the number of variables in the heap"""
+        return len(self.__heap)
+
+    def __contains__(self, var: int) -> bool:
+        """Returns: a boolean representing if var is in the heap"""
+        return var < len(self.__indices) and self.__indices[var] >= 0
+
+    def insert(self, var: int):
+        """Adds var to the heap if it is not already in it"""
+        while var >= len(self.__indices):
+            self.__indices.append(-1)
+        if self.__indices[var] >= 0:
+            return
+        self.__indices[var] = len(self.__heap)
+        self.__heap.append(var)
+        self.__sift_up(len(self.__heap) - 1)
+
+    def update(self, var: int):
+        """Moves var up the heap after its activity has increased"""
+        if var in self:
+            self.__sift_up(self.__indices[var])
+
+    def pop(self) -> int:
+        """Removes the variable with the highest activity from the heap
+
+        Returns: the removed variable id"""
+        heap = self.__heap
+        top = heap[0]
+        last = heap.pop()
+        self.__indices[top] = -1
+        if heap:
+            heap[0] = last
+            self.__indices[last] = 0
+            self.__sift_down(0)
+        return top
+
+    def __sift_up(self, pos: int):
+        """Moves the variable at pos up until its parent has at least its activity"""
+        heap = self.__heap
+        indices = self.__indices
+        activity = self.__activity
+        var = heap[pos]
+        act = activity[var]
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if activity[heap[parent]] >= act:
+                break
+            heap[pos] = heap[parent]
+            indices[heap[pos]] = pos
+            pos = parent
+        heap[pos] = var
+        indices[var] = pos
+
+    def __sift_down(self, pos: int):
+        """Moves the variable at pos down until both of its children have at most its activity"""
+        heap = self.__heap
+        indices = self.__indices
+        activity = self.__activity
+        var = heap[pos]
+        act = activity[var]
+        size = len(heap)
+        while True:
+            child = 2 * pos + 1
+            if child >= size:
+                break
+            if child + 1 < size and activity[heap[child + 1]] > activity[heap[child]]:
+                child += 1
+            if activity[heap[child]] <= act:
+                break
+            heap[pos] = heap[child]
+            indices[heap[pos]] = pos
+            pos = child
+        heap[pos] = var
+        indices[var] = pos
+
+
+class Learnt(list):
+    """Learnt object is a clause learned by the Solver from a conflict: a list of signed int 
+    literals carrying the scores the learned clause database is reduced by.
+
+    Attributes:
+        lbd: the literal block distance of the clause, the number of distinct decision levels 
+        among its literals; the lowest seen since it was learned
+        activity: grows every time the clause takes part in a conflict, decays otherwise
+    """
+    __slots__ = ('lbd', 'activity')
+
+    def __init__(self, lits: Iterable[int], lbd: int):
+        """Constructor method for the Learnt object
+
+        Example:
+        >>> cl = Learnt([-1, 2, 3], 2)
+        >>> cl.lbd
+        2
+        """
+        super().__init__(lits)
+        self.lbd = lbd
+        self.activity = 0.0
+
+
+class Solver(object):
+    """Solver object works on a proposition in conjunctive normal form where every variable has
+    been interned to a dense integer id (1, 2, 3, ...) and every literal is a signed int in the
+    style of DIMACS: +v for the variable v, -v for its negation. Uses the DPLL algorithm, with 
+    two watched literals per clause and an assignment trail split into decision levels, to find
+    if the proposition is satisfiable or unsatisfiable. In CDCL mode it learns clauses from 
+    conflicts, backjumps, restarts, and reduces its learned clauses every so many conflicts.
+
+    The solver is incremental: clauses and variables may be added between calls to solve(), 
+    which keeps what was learned, each call may be given assumptions, and push() and pop() 
+    open and close scopes of temporary clauses. With preprocessing on, the clauses are also 
+    rewritten at decision level 0 before the search (subsumption, equivalent literal 
+    substitution, bounded variable elimination) and the search probes for failed literals.
+
+    Properties:
+        UNSAT: returned when the proposition is unsatisfiable
+        SAT: returned when the propostion is satisfiable
+        LUBY, GEOMETRIC, GLUCOSE: the restart policies
+
+    Attributes:
+        num_vars: the number of variables known to the solver, ids run from 1 to num_vars
+        clauses: a list of clauses, each a list of signed int literals
+        values: a list indexed by variable id holding 1 for True, -1 for False, 0 if unassigned
+        watches: a dict from each literal to the list of clauses watching it
+        occurs: a dict from each literal to the list of clauses containing it, not counting the
+        learned clauses
+        counts: a dict from each literal to the number of clauses containing it that have no True
+        literal, kept by the search without clause learning
+        true_by: a dict from the id of each clause counted as True to the literal it was counted
+        True by
+        pure_head: the index in trail of the next literal whose clauses have not been counted as
+        True yet
+        pure: the literals that may have become pure since they were last looked for
+        units: the literals of the unit clauses, given or learned, assigned before any propagation
+        cdcl: a boolean representing if conflicts are learned from (True) or handled by 
+        chronological backtracking (False)
+        learnts: the Learnt clauses learned from conflicts in CDCL mode
+        cla_inc: the amount the activity of a Learnt clause is bumped by
+        conflicts: the number of conflicts over every call to solve(), which sets when the learned
+        clause database is reduced
+        levels: a list indexed by variable id holding the decision level it was assigned at
+        reasons: a list indexed by variable id holding the clause that implied its value, None 
+        for guesses and unit clauses
+        trail: the literals assigned True, in the order they were assigned
+        trail_lim: the index in trail where each decision level starts
+        qhead: the index in trail of the next literal whose watches have not yet been visited
+        activity: a list indexed by variable id holding its VSIDS activity
+        var_inc: the amount the activity of a variable is bumped by
+        order: a VarOrder heap of the variables that may be unassigned
+        phases: a list indexed by variable id holding the value it was last assigned, 1 or -1,
+        0 if it has never been assigned
+        restarts: the restart policy, one of LUBY, GEOMETRIC, GLUCOSE, or None
+        scopes: the activation variable of every open scope, innermost last
+        scope_starts: the number of clauses in the clauses attribute when each scope was opened
+        free_acts: the activation variables of closed scopes, which appear in no clause
+        simplified: the number of literals assigned at decision level 0 when the clauses were 
+        last simplified
+        preprocess: a boolean representing if the clauses are preprocessed before the search
+        eliminated: the elimination stack, a dict from each eliminated or substituted variable 
+        to the clauses removed with it, in the order the variables were taken out
+        touched: the variables in the clauses added or changed since the last preprocessing
+        added: the clauses added or strengthened since the last preprocessing, which may subsume
+        other clauses
+        signatures: a dict from the id of each clause to its signature, kept while preprocessing
+        is on
+        probed: a boolean representing if the clauses have been probed since a clause was last 
+        added or literals were last assigned at decision level 0
+    """
+
+    # Properties:
+    UNSAT = 'unsat'
+    SAT = 'sat'
+    VAR_DECAY = 0.95 # the activity of every variable decays by this factor per conflict
+    RESCALE_LIMIT = 1e100 # activities are scaled down once a bump would pass this value
+    LUBY = 'luby'
+    GEOMETRIC = 'geometric'
+    GLUCOSE = 'glucose'
+    RESTART_UNIT = 100 # conflicts before the first LUBY or GEOMETRIC restart
+    RESTART_GROWTH = 1.5 # factor the GEOMETRIC restart interval grows by
+    LBD_WINDOW = 50 # number of recent learned clauses in the GLUCOSE moving average
+    LBD_MARGIN = 0.8 # GLUCOSE restarts when recent average * LBD_MARGIN > overall average
+    CLAUSE_DECAY = 0.999 # the activity of every learned clause decays by this factor per conflict
+    GLUE_LBD = 2 # learned clauses with at most this LBD are never deleted
+    REDUCE_INTERVAL = 2000 # conflicts before the first learned clause database reduction
+    REDUCE_INCREMENT = 300 # conflicts added to the interval after every reduction
+    ELIM_OCCUR_LIMIT = 20 # variables in more clauses than this on both sides are not eliminated
+    ELIM_CLAUSE_LIMIT = 20 # variables whose elimination makes a longer clause are kept
+
+    def __init__(self, num_vars: int = 0, clauses: Iterable[Iterable[int]] = (), cdcl: bool = False,
+                 restarts: Union[str, None] = 'luby', preprocess: bool = False):
+        """Constructor method for the Solver object
+
+        args:
+            num_vars: the number of variables to create up front
+            clauses: iterable of clauses, each an iterable of signed int literals
+            cdcl: if the search should learn clauses from conflicts and backjump
+            restarts: the restart policy used in CDCL mode, 'luby', 'geometric', 'glucose', or 
+            None to never restart
+            preprocess: if the clauses should be preprocessed before the search
+
+        Raises:
+            ValueError if restarts is not a known restart policy
+
+        Example:
+        >>> solver = Solver(3, [[1, -2], [2, 3], [-1]])
+        >>> solver.get_num_vars()
+        3
+        """
+        if restarts not in (Solver.LUBY, Solver.GEOMETRIC, Solver.GLUCOSE, None):
+            raise ValueError(f"Unknown restart policy {restarts}.")
+        self.__num_vars = 0
+        self.__cdcl = cdcl
+        self.__restarts = restarts
+        self.__clauses = []
+        self.__learnts = []
+        self.__cla_inc = 1.0
+        self.__conflicts = 0
+        self.__reduce_limit = Solver.REDUCE_INTERVAL
+        self.__reductions = 0
+        self.__values = [0] # index 0 is unused so variable ids index directly
+        self.__watches = {}
+        self.__occurs = {}
+        self.__counts = {}
+        self.__true_by = {}
+        self.__pure_head = 0
+        self.__pure = []
+        self.__units = []
+        self.__levels = [0]
+        self.__reasons = [None]
+        self.__trail = []
+        self.__trail_lim = []
+        self.__qhead = 0
+        self.__activity = [0.0]
+        self.__var_inc = 1.0
+        self.__order = VarOrder(self.__activity)
+        self.__phases = [0]
+        self.__empty_clause = False
+        self.__scopes = []
+        self.__scope_starts = []
+        self.__free_acts = []
+        self.__simplified = 0
+        self.__preprocess = preprocess
+        self.__eliminated = {}
+        self.__touched = set()
+        self.__added = []
+        self.__signatures = {}
+        self.__probed = False
+        for _ in range(num_vars):
+            self.new_var()
+        for clause in clauses:
+            self.add_clause(clause)
+
+    def new_var(self) -> int:
+        """Creates a new variable
+
+        Returns: the int id of the new variable
+
+        Example:
+        >>> solver = Solver()
+        >>> solver.new_var()
+        1
+        >>> solver.new_var()
+        2
+        """
+        self.__num_vars += 1
+        self.__values.append(0)
+        self.__levels.append(0)
+        self.__reasons.append(None)
+        self.__activity.append(0.0)
+        self.__phases.append(0)
+        self.__order.insert(self.__num_vars)
+        self.__watches[self.__num_vars] = []
+        self.__watches[-self.__num_vars] = []
+        self.__occurs[self.__num_vars] = []
+        self.__occurs[-self.__num_vars] = []
+        return self.__num_vars
+
+    def get_num_vars(self) -> int:
+        """Returns: the number of variables known to the solver"""
+        return self.__num_vars
+
+    def get_clauses(self) -> list[list[int]]:
+        """Returns: the clauses attribute"""
+        return self.__clauses
+
+    def get_learnts(self) -> list['Learnt']:
+        """Returns: the learnts attribute"""
+        return self.__learnts
+
+    def get_occurrences(self, lit: int) -> list[list[int]]:
+        """Returns: the occurrence list of lit, the clauses containing it, not counting the 
+        learned clauses
+
+        Example:
+        >>> solver = Solver(2, [[1, -2], [1, 2], [-1]])
+        >>> solver.get_occurrences(1)
+        [[1, -2], [1, 2]]
+        """
+        return self.__occurs[lit]
+
+    def get_scopes(self) -> list[int]:
+        """Returns: the scopes attribute"""
+        return self.__scopes
+
+    def push(self) -> int:
+        """Opens a scope: the clauses added until the matching pop() only hold until then. Every
+        clause added in the scope gets the negation of its activation variable, which solve() 
+        assumes True while the scope is open, so anything learned from those clauses contains
+        it too and pop() can delete exactly them.
+
+        Returns: the activation variable of the scope, a new variable unless one can be reused
+
+        Example:
+        >>> solver = Solver(1)
+        >>> solver.push()
+        2
+        >>> solver.add_clause([-1])
+        >>> solver.solve([1])
+        'unsat'
+        >>> solver.pop()
+        >>> solver.solve([1])
+        'sat'
+        """
+        act = self.__free_acts.pop() if self.__free_acts else self.new_var()
+        self.__scopes.append(act)
+        self.__scope_starts.append(len(self.__clauses))
+        return act
+
+    def pop(self):
+        """Closes the innermost scope, deleting the clauses added in it and every clause learned
+        from them, which all contain the negation of its activation variable
+
+        Raises:
+            ValueError if there is no open scope
+        """
+        if not self.__scopes:
+            raise ValueError("There is no open scope to pop.")
+        act = self.__scopes.pop()
+        start = self.__scope_starts.pop()
+        deleted = self.__clauses[start:]
+        del self.__clauses[start:]
+        ids = {id(clause) for clause in deleted}
+        for clause_id in ids:
+            self.__signatures.pop(clause_id, None)
+        for lit in {lit for clause in deleted for lit in clause}:
+            self.__occurs[lit] = [cl for cl in self.__occurs[lit] if id(cl) not in ids]
+        kept = []
+        for clause in self.__learnts:
+            (deleted if -act in clause else kept).append(clause)
+        self.__learnts = kept
+        ids = {id(clause) for clause in deleted}
+        watched = {lit for clause in deleted for lit in clause[:2]}
+        for lit in watched:
+            self.__watches[lit] = [cl for cl in self.__watches[lit] if id(cl) not in ids]
+        units = len(self.__units)
+        self.__units = [lit for lit in self.__units if lit != -act]
+        self.__simplified -= units - len(self.__units)
+        self.__free_acts.append(act)
+
+    def add_clause(self, lits: Iterable[int]):
+        """Adds a clause of signed int literals to the proposition, in the innermost open scope 
+        if there is one. Duplicate literals are dropped and tautologies (clauses containing both 
+        v and -v) are disregarded since they can never be False.
+
+        Raises:
+            ValueError if a literal is 0 or refers to a variable the solver does not know
+
+        Example:
+        >>> solver = Solver(2)
+        >>> solver.add_clause([1, 1, -2])
+        >>> solver.add_clause([2, -2])
+        >>> solver.get_clauses()
+        [[1, -2]]
+        """
+        clause = []
+        seen = set()
+        for lit in lits:
+            if lit == 0 or abs(lit) > self.__num_vars:
+                raise ValueError(f"Literal {lit} does not refer to a known variable.")
+            if -lit in seen:
+                return # tautology
+            if lit not in seen:
+                seen.add(lit)
+                clause.append(lit)
+        for lit in clause:
+            if abs(lit) in self.__eliminated:
+                self.__restore(abs(lit))
+        if self.__scopes:
+            clause.append(-self.__scopes[-1])
+        self.__clauses.append(clause)
+        for lit in clause:
+            self.__occurs[lit].append(clause)
+        self.__probed = False
+        if self.__preprocess:
+            self.__signatures[id(clause)] = Solver.__signature(clause)
+        if self.__preprocess and not self.__scopes:
+            # the clauses of a scope are never preprocessed, pop() deletes them
+            self.__touched.update(abs(lit) for lit in clause)
+            self.__added.append(clause)
+        if not clause:
+            self.__empty_clause = True
+        elif len(clause) == 1:
+            self.__units.append(clause[0])
+        else:
+            self.__watches[clause[0]].append(clause)
+            self.__watches[clause[1]].append(clause)
+
+    def value(self, lit: int) -> Union[bool, None]:
+        """Returns: the truth value of the literal lit under the current assignment, or None
+        if its variable is unassigned"""
+        val = self.__values[lit] if lit > 0 else -self.__values[-lit]
+        return None if not val else val > 0
+
+    def get_model(self) -> list[Union[bool, None]]:
+        """Returns: the values attribute as booleans indexed by variable id; after a 'sat' result
+        from solve() it holds the assignment that satisfies the proposition, None for variables
+        never assigned"""
+        return [None if not val else val > 0 for val in self.__values]
+
+    def solve(self, assumptions: Iterable[int] = ()) -> str:
+        """Implements the DPLL algorithm to find if the proposition is satisfiable or
+        unsatisfiable, with every literal in assumptions True. The assumptions only hold for this
+        call; what was learned from earlier calls is reused. The activation variables of the open
+        scopes are assumed along with them.
+
+        Returns: a string representing if the proposition is satisfiable or not
+                'sat' if satisfiable
+                'unsat' if not satisfiable under the assumptions
+
+        Raises:
+            ValueError if an assumption is 0 or refers to a variable the solver does not know
+
+        Example:
+        >>> Solver(2, [[1, 2], [-1]]).solve()
+        'sat'
+        >>> Solver(2, [[1, 2], [-1]]).solve([-2])
+        'unsat'
+        >>> Solver(1, [[1], [-1]]).solve()
+        'unsat'
+        """
+        assumptions = list(assumptions)
+        for lit in assumptions:
+            if lit == 0 or abs(lit) > self.__num_vars:
+                raise ValueError(f"Literal {lit} does not refer to a known variable.")
+            if abs(lit) in self.__eliminated:
+                self.__restore(abs(lit))
+        assumptions = self.__scopes + assumptions
+        self.__values = [0] * (self.__num_vars + 1)
+        self.__levels = [0] * (self.__num_vars + 1)
+        self.__reasons = [None] * (self.__num_vars + 1)
+        self.__trail = []
+        self.__trail_lim = []
+        self.__qhead = 0
+        self.__pure_head = 0
+        for var in range(1, self.__num_vars + 1):
+            if var not in self.__eliminated:
+                self.__order.insert(var)
+        if self.__empty_clause:
+            return Solver.UNSAT
+        for lit in self.__units:
+            if not self.__enqueue(lit):
+                self.__empty_clause = True
+                return Solver.UNSAT
+        if self.__propagate() is not None:
+            # the unit clauses alone lead to a False clause
+            self.__empty_clause = True
+            return Solver.UNSAT
+        if len(self.__trail) > self.__simplified:
+            self.__simplify()
+        if self.__preprocess and (self.__added or self.__touched) and not self.__scopes:
+            if not self.__preprocess_clauses({abs(lit) for lit in assumptions}):
+                self.__empty_clause = True
+                return Solver.UNSAT
+        if self.__cdcl:
+            sat = self.__cdcl_search(assumptions)
+        else:
+            sat = self.__search(assumptions)
+        if sat and self.__eliminated:
+            self.__extend_model()
+        return Solver.SAT if sat else Solver.UNSAT
+
+    def __search(self, assumptions: list[int]) -> bool:
+        """DPLL search driven by a loop instead of recursion: guesses a value for the most active
+        unassigned variable on a new decision level and propagates it. When propagation finds a 
+        False clause, the search backtracks to the most recent guess whose opposite value has not 
+        been tried yet and tries it; if there is no such guess the proposition is unsatisfiable.
+        The decision levels on the trail act as the stack, so the search depth is not bounded by 
+        the recursion limit. The assumptions are guessed first and are never flipped. After the
+        assumptions, the pure literals are made True before every guess.
+
+        Returns: a boolean representing if the proposition is satisfiable under the assumptions"""
+        occurs = self.__occurs
+        self.__counts = {lit: len(clauses) for lit, clauses in occurs.items()}
+        self.__true_by = {}
+        self.__pure = [lit for lit in occurs if occurs[lit] and not occurs[-lit]]
+        flipped = [] # per decision level: if its guess is already the second value tried
+        probe = self.__preprocess and not self.__probed # if the root level is to be probed
+        while True:
+            if (conflict := self.__propagate()) is not None:
+                for lit in conflict:
+                    self.__bump(abs(lit))
+                self.__decay()
+                while flipped and flipped[-1]:
+                    flipped.pop()
+                if not flipped:
+                    # both values of every guess lead to a conflict
+                    return False
+                level = len(flipped) - 1
+                guess = self.__trail[self.__trail_lim[level]]
+                self.__backtrack(level)
+                flipped[level] = True
+                self.__decide(-guess)
+                continue
+            if assumptions and not self.__trail_lim:
+                if not self.__assume(assumptions):
+                    return False
+                flipped.append(True)
+                continue
+            if self.__assign_pure():
+                continue
+            if probe:
+                probe = False
+                if not self.__probe():
+                    return False
+                continue
+            var = self.__pick_branch_var()
+            if var is None:
+                # every variable is assigned without a conflict
+                return True
+            flipped.append(False)
+            self.__decide(self.__phase(var))
+
+    def __cdcl_search(self, assumptions: list[int]) -> bool:
+        """CDCL search: guesses a value for the most active unassigned variable on a new 
+        decision level and propagates it. When propagation finds a False clause at decision 
+        level 0 the proposition is unsatisfiable; otherwise a clause is learned from the conflict,
+        the search backjumps to the level where that clause becomes a unit clause, and its 
+        remaining literal is propagated. Restarts from level 0 whenever the restart policy says to.
+        The assumptions are guessed first, on decision level 1, which restarts go back to instead
+        of level 0; a conflict on level 1 ends the search.
+
+        Returns: a boolean representing if the proposition is satisfiable under the assumptions"""
+        root = 1 if assumptions else 0 # the decision level restarts go back to
+        restarts = 0
+        limit = self.__restart_limit(restarts)
+        conflicts = 0 # conflicts since the last restart
+        lbd_recent = deque(maxlen=Solver.LBD_WINDOW)
+        lbd_total = lbd_count = 0
+        probe = self.__preprocess and not self.__probed # if the root level is to be probed
+        while True:
+            conflict = self.__propagate()
+            if conflict is not None:
+                if not self.__trail_lim:
+                    # the proposition itself implies the False clause, whatever is assumed
+                    self.__empty_clause = True
+                    return False
+                if len(self.__trail_lim) == root:
+                    # the assumptions imply the False clause
+                    return False
+                learnt, level = self.__analyze(conflict)
+                lbd = self.__lbd(learnt)
+                lbd_recent.append(lbd)
+                lbd_total += lbd
+                lbd_count += 1
+                self.__backtrack(level)
+                self.__learn(learnt, lbd)
+                self.__decay()
+                conflicts += 1
+                self.__conflicts += 1
+                if self.__conflicts >= self.__reduce_limit:
+                    self.__reduce_db()
+                    self.__reductions += 1
+                    self.__reduce_limit = self.__conflicts + Solver.REDUCE_INTERVAL + \
+                        Solver.REDUCE_INCREMENT * self.__reductions
+                if self.__restarts == Solver.GLUCOSE:
+                    restart = (len(lbd_recent) == Solver.LBD_WINDOW and
+                               sum(lbd_recent) / Solver.LBD_WINDOW * Solver.LBD_MARGIN 
+                               > lbd_total / lbd_count)
+                else:
+                    restart = limit is not None and conflicts >= limit
+                if restart:
+                    self.__backtrack(root)
+                    restarts += 1
+                    limit = self.__restart_limit(restarts)
+                    conflicts = 0
+                    lbd_recent.clear()
+                continue
+            if assumptions and not self.__trail_lim:
+                if not self.__assume(assumptions):
+                    return False
+                continue
+            if probe:
+                probe = False
+                if not self.__probe():
+                    return False
+                continue
+            var = self.__pick_branch_var()
+            if var is None:
+                # every variable is assigned without a conflict
+                return True
+            self.__decide(self.__phase(var))
+
+    def __restart_limit(self, restarts: int) -> Union[float, None]:
+        """LUBY restarts after RESTART_UNIT times the next term of the Luby sequence conflicts,
+        GEOMETRIC after RESTART_UNIT conflicts growing by RESTART_GROWTH each time. GLUCOSE 
+        restarts by the average LBD of the recent learned clauses instead, and None never does.
+
+        Returns: the number of conflicts before the next LUBY or GEOMETRIC restart after 
+        restarts restarts, None for the other policies"""
+        if self.__restarts == Solver.LUBY:
+            return Solver.RESTART_UNIT * Solver.luby(restarts)
+        if self.__restarts == Solver.GEOMETRIC:
+            return Solver.RESTART_UNIT * Solver.RESTART_GROWTH ** restarts
+        return None
+
+    @staticmethod
+    def luby(i: int) -> int:
+        """Returns: the term at index i of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ...
+
+        Example:
+        >>> [Solver.luby(i) for i in range(7)]
+        [1, 1, 2, 1, 1, 2, 4]
+        """
+        # find the finite subsequence 1, 1, 2, ..., 2 ** seq that contains index i
+        size, seq = 1, 0
+        while size < i + 1:
+            seq += 1
+            size = 2 * size + 1
+        while size - 1 != i:
+            size = (size - 1) >> 1
+            seq -= 1
+            i = i % size
+        return 2 ** seq
+
+    def __lbd(self, clause: list[int]) -> int:
+        """Returns: the literal block distance of clause, the number of distinct decision levels
+        among its literals"""
+        levels = self.__levels
+        return len({levels[abs(lit)] for lit in clause})
+
+    def __analyze(self, conflict: list[int]) -> tuple[list[int], int]:
+        """Derives the first unique implication point (1-UIP) clause from a False clause by 
+        resolving it with the reasons of the literals assigned at the current decision level, 
+        most recent first, until exactly one literal of that level is left. Bumps the activity
+        of every variable resolved on or added to the learned clause and of every learned clause
+        resolved with, whose LBD is also updated if it has dropped.
+
+        Returns: the learned clause with the negation of the unique implication point first and 
+        a literal of the highest remaining decision level second, and the level to backjump to"""
+        levels = self.__levels
+        reasons = self.__reasons
+        trail = self.__trail
+        level = len(self.__trail_lim)
+        seen = set()
+        learnt = [0] # placeholder for the negated unique implication point
+        pending = 0 # literals of the current level still to be resolved away
+        index = len(trail) - 1
+        clause = conflict
+        lit = 0
+        while True:
+            if type(clause) is Learnt:
+                self.__bump_clause(clause)
+                if clause.lbd > Solver.GLUE_LBD:
+                    clause.lbd = min(clause.lbd, self.__lbd(clause))
+            for q in (clause if lit == 0 else clause[1:]):
+                var = abs(q)
+                if var not in seen and levels[var] > 0:
+                    seen.add(var)
+                    self.__bump(var)
+                    if levels[var] == level:
+                        pending += 1
+                    else:
+                        learnt.append(q)
+            # the most recently assigned literal of the clause is resolved on next
+            while abs(trail[index]) not in seen:
+                index -= 1
+            lit = trail[index]
+            index -= 1
+            pending -= 1
+            if pending == 0:
+                break
+            clause = reasons[abs(lit)]
+        learnt[0] = -lit
+        if len(learnt) == 1:
+            return learnt, 0
+        # watch a literal of the level being backjumped to, it is the last one to be unassigned
+        high = max(range(1, len(learnt)), key=lambda i: levels[abs(learnt[i])])
+        learnt[1], learnt[high] = learnt[high], learnt[1]
+        return learnt, levels[abs(learnt[1])]
+
+    def __learn(self, learnt: list[int], lbd: int):
+        """Adds learnt to the learnts attribute as a Learnt clause with literal block distance lbd
+        and assigns its first literal, which every other literal of the clause being False leaves
+        as the only one that can make it True"""
+        if len(learnt) > 1:
+            clause = Learnt(learnt, lbd)
+            self.__bump_clause(clause)
+            self.__learnts.append(clause)
+            self.__watches[clause[0]].append(clause)
+            self.__watches[clause[1]].append(clause)
+            self.__enqueue(clause[0], clause)
+        else:
+            # a learned unit clause holds on every later call too
+            self.__units.append(learnt[0])
+            self.__enqueue(learnt[0])
+
+    def __bump_clause(self, clause: Learnt):
+        """Increases the activity of clause by cla_inc, rescaling every learned clause activity 
+        if it grows too large"""
+        clause.activity += self.__cla_inc
+        if clause.activity > Solver.RESCALE_LIMIT:
+            for learnt in self.__learnts:
+                learnt.activity *= 1 / Solver.RESCALE_LIMIT
+            self.__cla_inc *= 1 / Solver.RESCALE_LIMIT
+
+    def __reduce_db(self):
+        """Deletes the worse half of the learned clauses, by highest LBD then lowest activity.
+        Glue clauses and clauses that are the reason for a current assignment are kept."""
+        values = self.__values
+        reasons = self.__reasons
+        candidates = []
+        kept = []
+        for clause in self.__learnts:
+            first = clause[0]
+            locked = reasons[abs(first)] is clause and \
+                (values[first] if first > 0 else -values[-first]) > 0
+            if clause.lbd <= Solver.GLUE_LBD or locked:
+                kept.append(clause)
+            else:
+                candidates.append(clause)
+        candidates.sort(key=lambda cl: (-cl.lbd, cl.activity))
+        half = len(candidates) // 2
+        deleted = {id(clause) for clause in candidates[:half]}
+        if not deleted:
+            return
+        watched = {lit for clause in candidates[:half] for lit in clause[:2]}
+        for lit in watched:
+            self.__watches[lit] = [cl for cl in self.__watches[lit] if id(cl) not in deleted]
+        self.__learnts = kept + candidates[half:]
+
+    def __simplify(self):
+        """Deletes the clauses and learned clauses with a literal True at decision level 0 and
+        removes the literals False at level 0 from the rest, in place. After propagation, a 
+        clause without a True literal has its two watched literals unassigned, so only the 
+        unwatched literals are removed and the watches stay as they are. Every literal assigned
+        at level 0 becomes a unit clause."""
+        values = self.__values
+        deleted = []
+        removed = set() # the False literals removed from the clauses
+
+        def satisfied(clause: list[int]) -> bool:
+            """Returns: a boolean representing if clause has a True literal, after removing its
+            False literals if it does not"""
+            k = 2
+            for lit in clause:
+                if (values[lit] if lit > 0 else -values[-lit]) > 0:
+                    deleted.append(clause)
+                    return True
+            while k < len(clause):
+                lit = clause[k]
+                if (values[lit] if lit > 0 else -values[-lit]) < 0:
+                    clause[k] = clause[-1]
+                    clause.pop()
+                    removed.add(lit)
+                else:
+                    k += 1
+            return False
+
+        clauses = self.__clauses
+        starts = self.__scope_starts
+        scope = 0
+        kept = 0
+        signatures = self.__signatures
+        for i, clause in enumerate(clauses):
+            while scope < len(starts) and starts[scope] == i:
+                # the clauses of the scope now start at the kept clauses before it
+                starts[scope] = kept
+                scope += 1
+            length = len(clause)
+            if not satisfied(clause):
+                clauses[kept] = clause
+                kept += 1
+                if self.__preprocess and len(clause) < length:
+                    signatures[id(clause)] = Solver.__signature(clause)
+        for scope in range(scope, len(starts)):
+            starts[scope] = kept
+        del clauses[kept:]
+        self.__learnts = [clause for clause in self.__learnts if not satisfied(clause)]
+        ids = {id(clause) for clause in deleted}
+        for clause_id in ids:
+            signatures.pop(clause_id, None)
+        watched = {lit for clause in deleted if len(clause) > 1 for lit in clause[:2]}
+        for lit in watched:
+            self.__watches[lit] = [cl for cl in self.__watches[lit] if id(cl) not in ids]
+        # a removed literal is False at level 0, so no clause is left containing it
+        for lit in removed:
+            self.__occurs[lit] = []
+        for lit in {lit for clause in deleted for lit in clause} - removed:
+            self.__occurs[lit] = [cl for cl in self.__occurs[lit] if id(cl) not in ids]
+        # the deleted clauses may have implied some of the level 0 literals, which later solves 
+        # then take from the unit clauses instead
+        self.__units = self.__trail.copy()
+        self.__simplified = len(self.__trail)
+        self.__probed = False
+
+    def __assign_pure(self) -> bool:
+        """Counts the clauses of the literals put on the trail since the last call as True, then
+        assigns every pure literal True at the current decision level
+
+        Returns: a boolean representing if any pure literal was assigned"""
+        counts = self.__counts
+        true_by = self.__true_by
+        pure = self.__pure
+        trail = self.__trail
+        for lit in trail[self.__pure_head:]:
+            for clause in self.__occurs[lit]:
+                if id(clause) not in true_by:
+                    true_by[id(clause)] = lit
+                    for other in clause:
+                        counts[other] -= 1
+                        if not counts[other]:
+                            # -other is left in no clause without a True literal
+                            pure.append(-other)
+        self.__pure_head = len(trail)
+        values = self.__values
+        assigned = False
+        while pure:
+            lit = pure.pop()
+            if not values[abs(lit)] and counts[lit] and not counts[-lit]:
+                self.__enqueue(lit)
+                assigned = True
+        return assigned
+
+    def __unassign_pure(self, start: int):
+        """Restores the counts of the clauses counted as True by the literals on the trail from
+        index start on, most recent first"""
+        counts = self.__counts
+        true_by = self.__true_by
+        for lit in reversed(self.__trail[start:self.__pure_head]):
+            for clause in self.__occurs[lit]:
+                if true_by.get(id(clause)) == lit:
+                    del true_by[id(clause)]
+                    for other in clause:
+                        counts[other] += 1
+        self.__pure_head = start
+
+    def __preprocess_clauses(self, frozen: set[int]) -> bool:
+        """Preprocesses the clauses at decision level 0, after they have been simplified so that
+        none of them has an assigned literal. The watches are rebuilt once at the end, and the 
+        unit clauses found are propagated.
+
+        args:
+            frozen: the variables that may not be eliminated or substituted
+
+        Returns: a boolean representing if the clauses may still be satisfiable, False when the 
+        empty clause was derived"""
+        self.__simplify()
+        units = len(self.__units)
+        removed = {}
+        while self.__added or self.__touched:
+            if not self.__subsume(removed) or not self.__substitute(frozen, removed) or \
+                    not self.__eliminate(frozen, removed):
+                return False
+        if removed:
+            self.__clauses = [clause for clause in self.__clauses if id(clause) not in removed]
+            for clause_id in removed:
+                del self.__signatures[clause_id]
+            self.__learnts = [clause for clause in self.__learnts 
+                              if all(abs(lit) not in self.__eliminated for lit in clause)]
+        self.__rewatch()
+        for lit in self.__units[units:]:
+            if not self.__enqueue(lit):
+                return False
+        if self.__propagate() is not None:
+            return False
+        if len(self.__trail) > self.__simplified:
+            self.__simplify()
+        return True
+
+    def __subsume(self, removed: dict[int, list[int]]) -> bool:
+        """Backward subsumption and self-subsuming resolution with every clause added or 
+        strengthened since the last call: the clauses containing its rarest literal or the
+        negation of it are looked through, skipping those whose signature is missing a variable
+        of the clause. A clause containing every literal of it is removed; a clause containing
+        every literal of it but one, and the negation of that one, has the negation removed and 
+        is tried itself in turn.
+
+        args:
+            removed: the clauses taken out so far, by id
+
+        Returns: a boolean representing if the clauses may still be satisfiable, False when a 
+        clause was strengthened to the empty clause"""
+        occurs = self.__occurs
+        values = self.__values
+        signatures = self.__signatures
+        while self.__added:
+            added = self.__added
+            self.__added = []
+            for clause in added:
+                if id(clause) in removed or \
+                        any(values[lit] for lit in clause if lit > 0) or \
+                        any(values[-lit] for lit in clause if lit < 0):
+                    # deleted since it was added, by the preprocessing or by simplification
+                    continue
+                sig = signatures[id(clause)]
+                best = min(clause, key=lambda lit: len(occurs[lit]) + len(occurs[-lit]))
+                lits = set(clause)
+                for other in occurs[best] + occurs[-best]:
+                    if other is clause or len(other) < len(clause) or \
+                            sig & ~signatures[id(other)] or id(other) in removed:
+                        continue
+                    # the literal of clause that other holds the negation of, if there is one
+                    flipped = 0
+                    others = set(other)
+                    for lit in lits:
+                        if lit not in others:
+                            if flipped or -lit not in others:
+                                break
+                            flipped = lit
+                    else:
+                        if not flipped:
+                            self.__remove_clause(other, removed)
+                        elif not self.__strengthen(other, -flipped):
+                            return False
+        return True
+
+    def __probe(self) -> bool:
+        """Failed literal probing at the current decision level, the root of the search: every 
+        unassigned literal whose negation is in a binary clause is assigned on a new level and 
+        propagated, then unassigned. The negation of a literal that leads to a False clause, and
+        every literal implied by both literals of a variable, is assigned at the root level and 
+        propagated, and made a unit clause if the root level is 0. The saved phases are left as 
+        they were.
+
+        Returns: a boolean representing if the proposition may still be satisfiable under the 
+        assumptions, False when what was found leads to a False clause"""
+        occurs = self.__occurs
+        values = self.__values
+        trail = self.__trail
+        root = len(self.__trail_lim)
+        phases = self.__phases.copy()
+
+        def fix(lit: int) -> bool:
+            """Assigns lit at the root level and propagates it
+
+            Returns: a boolean representing if that did not lead to a False clause"""
+            if not root:
+                self.__units.append(lit)
+            return self.__enqueue(lit) and self.__propagate() is None
+
+        for var in range(1, self.__num_vars + 1):
+            implied = []
+            for lit in (var, -var):
+                if values[var] or not any(len(clause) == 2 for clause in occurs[-lit]):
+                    implied.append(set())
+                    continue
+                start = len(trail)
+                self.__decide(lit)
+                conflict = self.__propagate()
+                implied.append(set(trail[start + 1:]))
+                self.__backtrack(root)
+                if conflict is not None:
+                    if not fix(-lit):
+                        return False
+                    break
+            else:
+                for lit in implied[0] & implied[1]:
+                    if not values[abs(lit)] and not fix(lit):
+                        return False
+        self.__phases = phases
+        self.__probed = True
+        return True
+
+    @staticmethod
+    def __signature(clause: list[int]) -> int:
+        """Returns: the signature of clause, a 64 bit mask with the bit of every variable in it 
+        set, so that a clause can only contain another if its signature has every bit of the 
+        other's"""
+        sig = 0
+        for lit in clause:
+            sig |= 1 << (abs(lit) & 63)
+        return sig
+
+    def __strengthen(self, clause: list[int], lit: int) -> bool:
+        """Removes lit from clause, and clause from the occurrence list of lit, queueing clause 
+        to subsume others; the watches are rebuilt afterwards
+
+        Returns: a boolean representing if the clause is not empty"""
+        clause.remove(lit)
+        occurs = self.__occurs[lit]
+        for i, other in enumerate(occurs):
+            if other is clause:
+                occurs[i] = occurs[-1]
+                occurs.pop()
+                break
+        self.__touched.add(abs(lit))
+        self.__added.append(clause)
+        self.__signatures[id(clause)] = Solver.__signature(clause)
+        if not clause:
+            return False
+        if len(clause) == 1:
+            self.__units.append(clause[0])
+        return True
+
+    def __substitute(self, frozen: set[int], removed: dict[int, list[int]]) -> bool:
+        """Equivalent literal substitution: the literals in a strongly connected component of the
+        binary implication graph, where each binary clause [a, b] is the edges -a -> b and
+        -b -> a, all imply each other, so each of their variables is replaced in every clause by
+        a representative of the component, a frozen variable if there is one. A substituted
+        variable goes on the elimination stack with the two clauses making it equivalent to its
+        representative, so it is given a value and restored like an eliminated variable.
+
+        args:
+            frozen: the variables that may not be substituted
+            removed: the clauses taken out so far, by id
+
+        Returns: a boolean representing if the clauses may still be satisfiable, False when a 
+        literal is equivalent to its own negation"""
+        occurs = self.__occurs
+        values = self.__values
+        eliminated = self.__eliminated
+        frozen = frozen | set(self.__free_acts)
+        graph = {}
+        for clause in self.__clauses:
+            if len(clause) == 2 and id(clause) not in removed:
+                graph.setdefault(-clause[0], []).append(clause[1])
+                graph.setdefault(-clause[1], []).append(clause[0])
+        substitutes = {}
+        for component in Solver.__components(graph):
+            if len({abs(lit) for lit in component}) < len(component):
+                return False
+            rep = min(component, key=lambda lit: (abs(lit) not in frozen, abs(lit)))
+            for lit in component:
+                var = abs(lit)
+                if lit == rep or var in frozen or var in substitutes or values[var] or \
+                        any(len(clause) == 1 for clause in occurs[var] + occurs[-var]):
+                    # the component of the negations is the same one with every sign flipped
+                    continue
+                substitutes[lit] = rep
+                substitutes[-lit] = -rep
+        for var in [var for var in substitutes if var > 0]:
+            rep = substitutes[var]
+            eliminated[var] = [[var, -rep], [-var, rep]]
+            for clause in occurs[var] + occurs[-var]:
+                self.__remove_clause(clause, removed)
+                lits = list(dict.fromkeys(substitutes.get(lit, lit) for lit in clause))
+                if len({abs(lit) for lit in lits}) < len(lits):
+                    continue # a tautology, as the clauses linking var to rep become
+                if not self.__add_derived(lits):
+                    return False
+        return True
+
+    @staticmethod
+    def __components(graph: dict[int, list[int]]) -> list[list[int]]:
+        """Tarjan's algorithm, driven by a stack of edge iterators instead of recursion
+
+        Returns: the strongly connected components of graph with more than one node"""
+        index = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        components = []
+        for root in graph:
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(graph[root]))]
+            while work:
+                node, edges = work[-1]
+                for succ in edges:
+                    if succ not in index:
+                        index[succ] = low[succ] = len(index)
+                        stack.append(succ)
+                        on_stack.add(succ)
+                        work.append((succ, iter(graph.get(succ, ()))))
+                        break
+                    if succ in on_stack:
+                        low[node] = min(low[node], index[succ])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            lit = stack.pop()
+                            on_stack.discard(lit)
+                            component.append(lit)
+                            if lit == node:
+                                break
+                        if len(component) > 1:
+                            components.append(component)
+        return components
+
+    def __eliminate(self, frozen: set[int], removed: dict[int, list[int]]) -> bool:
+        """Bounded variable elimination: every touched variable, cheapest first, is replaced by
+        the resolvents of its clauses on it, as long as none of them is longer than 
+        ELIM_CLAUSE_LIMIT and there are no more of them than the clauses they replace. Variables 
+        touched by an elimination are tried again. Learned clauses containing an eliminated 
+        variable are deleted.
+
+        args:
+            frozen: the variables that may not be eliminated
+            removed: the clauses taken out so far, by id
+
+        Returns: a boolean representing if the clauses may still be satisfiable, False when an 
+        empty resolvent was derived"""
+        occurs = self.__occurs
+        values = self.__values
+        eliminated = self.__eliminated
+        frozen = frozen | set(self.__free_acts)
+        cost = lambda var: len(occurs[var]) * len(occurs[-var])
+        while self.__touched:
+            queue = sorted(self.__touched, key=cost)
+            self.__touched = set()
+            for var in queue:
+                if var in frozen or var in eliminated or values[var]:
+                    continue
+                pos = occurs[var]
+                neg = occurs[-var]
+                if not pos and not neg or \
+                        len(pos) > Solver.ELIM_OCCUR_LIMIT and len(neg) > Solver.ELIM_OCCUR_LIMIT:
+                    continue
+                if any(len(clause) == 1 for clause in pos + neg):
+                    # the variable is assigned by propagation once the preprocessing is done
+                    continue
+                resolvents = []
+                bound = len(pos) + len(neg)
+                for clause in pos:
+                    for other in neg:
+                        resolvent = Solver.__resolve(clause, other, var)
+                        if resolvent is None:
+                            continue
+                        resolvents.append(resolvent)
+                        if len(resolvent) > Solver.ELIM_CLAUSE_LIMIT or len(resolvents) > bound:
+                            break
+                    else:
+                        continue
+                    break
+                else:
+                    eliminated[var] = pos + neg
+                    for clause in pos + neg:
+                        self.__remove_clause(clause, removed)
+                    for resolvent in resolvents:
+                        if not self.__add_derived(resolvent):
+                            return False
+        return True
+
+    @staticmethod
+    def __resolve(clause: list[int], other: list[int], var: int) -> Union[list[int], None]:
+        """Returns: the resolvent of clause, containing var, and other, containing -var, None if
+        it is a tautology"""
+        lits = set(clause)
+        lits.discard(var)
+        for lit in other:
+            if lit == -var:
+                continue
+            if -lit in lits:
+                return None
+            lits.add(lit)
+        return list(lits)
+
+    def __remove_clause(self, clause: list[int], removed: dict[int, list[int]]):
+        """Takes clause out of the occurrence lists and records it in removed, by id, so it is 
+        taken out of the clauses attribute at the end of the preprocessing, touching its 
+        variables"""
+        for lit in clause:
+            occurs = self.__occurs[lit]
+            for i, other in enumerate(occurs):
+                if other is clause:
+                    occurs[i] = occurs[-1]
+                    occurs.pop()
+                    break
+            self.__touched.add(abs(lit))
+        removed[id(clause)] = clause
+
+    def __add_derived(self, lits: list[int]) -> bool:
+        """Adds a clause derived by the preprocessing to the clauses and the occurrence lists,
+        touching its variables; the watches are rebuilt afterwards
+
+        Returns: a boolean representing if the clause is not empty"""
+        if not lits:
+            return False
+        self.__clauses.append(lits)
+        self.__added.append(lits)
+        self.__signatures[id(lits)] = Solver.__signature(lits)
+        for lit in lits:
+            self.__occurs[lit].append(lits)
+            self.__touched.add(abs(lit))
+        if len(lits) == 1:
+            self.__units.append(lits[0])
+        return True
+
+    def __rewatch(self):
+        """Rebuilds the watches of every clause and learned clause, watching their first two 
+        literals"""
+        watches = self.__watches
+        for lit in watches:
+            watches[lit] = []
+        for clauses in (self.__clauses, self.__learnts):
+            for clause in clauses:
+                if len(clause) > 1:
+                    watches[clause[0]].append(clause)
+                    watches[clause[1]].append(clause)
+
+    def __restore(self, var: int):
+        """Takes var off the elimination stack and adds the clauses removed with it back in 
+        front of the open scopes, restoring every eliminated variable they contain along with 
+        it"""
+        restored = []
+        stack = [var]
+        while stack:
+            clauses = self.__eliminated.pop(stack.pop(), None)
+            if clauses is None:
+                continue
+            restored.extend(clauses)
+            stack.extend(abs(lit) for clause in clauses for lit in clause 
+                         if abs(lit) in self.__eliminated)
+        at = self.__scope_starts[0] if self.__scope_starts else len(self.__clauses)
+        self.__clauses[at:at] = restored
+        self.__probed = False
+        self.__scope_starts = [start + len(restored) for start in self.__scope_starts]
+        for clause in restored:
+            for lit in clause:
+                self.__occurs[lit].append(clause)
+            if len(clause) == 1:
+                self.__units.append(clause[0])
+            else:
+                self.__watches[clause[0]].append(clause)
+                self.__watches[clause[1]].append(clause)
+            if self.__preprocess:
+                self.__touched.update(abs(lit) for lit in clause)
+                self.__added.append(clause)
+                self.__signatures[id(clause)] = Solver.__signature(clause)
+
+    def __extend_model(self):
+        """Gives every eliminated variable a value, going through the elimination stack in 
+        reverse: the variable starts False and is set to make True every clause removed with it
+        that the values of the other variables leave False"""
+        values = self.__values
+        for var, clauses in reversed(self.__eliminated.items()):
+            values[var] = -1
+            for clause in clauses:
+                if not any((values[lit] if lit > 0 else -values[-lit]) > 0 for lit in clause):
+                    values[var] = 1 if var in clause else -1
+
+    def __bump(self, var: int):
+        """Increases the activity of var by var_inc, rescaling every activity if it grows too large"""
+        activity = self.__activity
+        activity[var] += self.__var_inc
+        if activity[var] > Solver.RESCALE_LIMIT:
+            for v in range(1, self.__num_vars + 1):
+                activity[v] *= 1 / Solver.RESCALE_LIMIT
+            self.__var_inc *= 1 / Solver.RESCALE_LIMIT
+        self.__order.update(var)
+
+    def __decay(self):
+        """Decays the activity of every variable and learned clause by growing the amount future
+        bumps add"""
+        self.__var_inc *= 1 / Solver.VAR_DECAY
+        self.__cla_inc *= 1 / Solver.CLAUSE_DECAY
+
+    def __decide(self, lit: int):
+        """Opens a new decision level and assigns the guess lit True on it"""
+        self.__trail_lim.append(len(self.__trail))
+        self.__enqueue(lit)
+
+    def __assume(self, assumptions: list[int]) -> bool:
+        """Opens decision level 1 and assigns every literal in assumptions True on it
+
+        Returns: a boolean representing if the assumptions can be made, False when one of them
+        is already False"""
+        self.__trail_lim.append(len(self.__trail))
+        for lit in assumptions:
+            if not self.__enqueue(lit):
+                return False
+        return True
+
+    def __backtrack(self, level: int):
+        """Unassigns every literal on the trail above decision level level, saving the value 
+        each one held as the phase of its variable"""
+        if len(self.__trail_lim) <= level:
+            return
+        values = self.__values
+        phases = self.__phases
+        order = self.__order
+        start = self.__trail_lim[level]
+        if self.__pure_head > start:
+            self.__unassign_pure(start)
+        for lit in self.__trail[start:]:
+            values[abs(lit)] = 0
+            phases[abs(lit)] = 1 if lit > 0 else -1
+            order.insert(abs(lit))
+        del self.__trail[start:]
+        del self.__trail_lim[level:]
+        self.__qhead = start
+
+    def __pick_branch_var(self) -> Union[int, None]:
+        """Returns: the unassigned variable with the highest activity that is not eliminated, 
+        None if every such variable is assigned"""
+        values = self.__values
+        order = self.__order
+        eliminated = self.__eliminated
+        while len(order):
+            # assigned and eliminated variables are left in the heap until they are popped
+            var = order.pop()
+            if not values[var] and var not in eliminated:
+                return var
+        return None
+
+    def __phase(self, var: int) -> int:
+        """Returns: the literal of var to guess, the value var last held, or the literal of var
+        that occurs in more clauses if var has never been assigned"""
+        phase = self.__phases[var]
+        if not phase:
+            phase = 1 if len(self.__occurs[var]) >= len(self.__occurs[-var]) else -1
+        return var if phase > 0 else -var
+
+    def __enqueue(self, lit: int, reason: Union[list[int], None] = None) -> bool:
+        """Assigns lit True at the current decision level and puts it on the trail if its 
+        variable is unassigned, reason being the clause that implied it
+
+        Returns: a boolean representing if lit is True afterwards, False when it was already 
+        assigned False"""
+        val = self.__values[lit] if lit > 0 else -self.__values[-lit]
+        if val:
+            return val > 0
+        self.__values[abs(lit)] = 1 if lit > 0 else -1
+        self.__levels[abs(lit)] = len(self.__trail_lim)
+        self.__reasons[abs(lit)] = reason
+        self.__trail.append(lit)
+        return True
+
+    def __propagate(self) -> Union[list[int], None]:
+        """Applies the unit clause heuristic through the watches of every literal on the trail
+        that has not been propagated yet. For each clause watching a literal that has become False,
+        a new unassigned or True literal is found to watch instead; if there is none, the other 
+        watched literal is the last one that can make the clause True and is assigned with the 
+        clause as its reason (or the clause is False).
+
+        Returns: the first False clause found, None if propagation finished without one"""
+        values = self.__values
+        levels = self.__levels
+        reasons = self.__reasons
+        watches = self.__watches
+        trail = self.__trail
+        level = len(self.__trail_lim)
+        while self.__qhead < len(trail):
+            false_lit = -trail[self.__qhead]
+            self.__qhead += 1
+            watchers = watches[false_lit]
+            kept = []
+            for i, clause in enumerate(watchers):
+                # keep the other watched literal in clause[0] and the False one in clause[1]
+                if clause[0] == false_lit:
+                    clause[0] = clause[1]
+                    clause[1] = false_lit
+                first = clause[0]
+                first_val = values[first] if first > 0 else -values[-first]
+                if first_val > 0:
+                    kept.append(clause)
+                    continue
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if (values[lit] if lit > 0 else -values[-lit]) >= 0:
+                        clause[1] = lit
+                        clause[k] = false_lit
+                        watches[lit].append(clause)
+                        break
+                else:
+                    kept.append(clause)
+                    if first_val < 0:
+                        # every literal in the clause is False
+                        kept.extend(watchers[i + 1:])
+                        watches[false_lit] = kept
+                        return clause
+                    values[abs(first)] = 1 if first > 0 else -1
+                    levels[abs(first)] = level
+                    reasons[abs(first)] = clause
+                    trail.append(first)
+            watches[false_lit] = kept
+        return None
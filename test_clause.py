@@ -227,4 +227,34 @@ def test_clause_contains():
     cl = Clause(a, b, c, d)
     arr = [a, b, c, d]
     for lit in arr:
-        assert lit in cl
\ No newline at end of file
+        assert lit in cl
+
+def test_clause_sorted():
+    # test that the Literals of a clause are kept sorted by id without duplicates
+    a = Literal('a')
+    b = Literal('b')
+    c = Literal('c')
+    cl = Clause(c, b.NOT(), a, c)
+    assert [lit.get_id() for lit in cl] == sorted(lit.get_id() for lit in (a, b.NOT(), c))
+    assert cl == Clause(a, b.NOT(), c)
+    assert hash(cl) == hash(Clause(b.NOT(), c, a))
+    assert cl != Clause(a, b, c)
+    assert len({cl, Clause(a, c, b.NOT())}) == 1
+    assert b.NOT() in cl
+    assert b not in cl
+
+def test_clause_status_cached():
+    # test that the clause status follows the assignment store without set_status calls
+    a = Literal('a')
+    b = Literal('b')
+    cl = Clause(a, b.NOT())
+    assert cl.get_status() is None
+    version = Literal.get_assignment_version()
+    b.set_internal_status()
+    assert Literal.get_assignment_version() > version
+    assert cl.get_status() is None
+    a.set_internal_status(False)
+    assert cl.get_status() == False
+    b.set_internal_status(False)
+    assert cl.get_status() == True
+    assert copy.copy(cl).get_status() == True
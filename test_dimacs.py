@@ -0,0 +1,103 @@
+"""Test suite for dimacs.py"""
+
+import io
+import pytest
+from dimacs import read_dimacs
+from dpll import DPLL
+from Literal import Literal
+from Clause import Clause
+
+CNF = b"""c a small example
+c with two comment lines
+p cnf 5 4
+1 -2 3 0
+-1 4 0
+2 -3 5 0
+-4 -5 0
+"""
+
+
+def test_read_dimacs():
+    num_vars, clauses = read_dimacs(io.BytesIO(CNF))
+    assert num_vars == 5
+    assert clauses == [[1, -2, 3], [-1, 4], [2, -3, 5], [-4, -5]]
+
+def test_read_dimacs_text_and_chunks():
+    expected = read_dimacs(io.BytesIO(CNF))
+    assert read_dimacs(io.StringIO(CNF.decode())) == expected
+    for chunk_size in (1, 3, 7, 16):
+        assert read_dimacs(io.BytesIO(CNF), chunk_size=chunk_size) == expected
+
+def test_read_dimacs_file_and_mmap(tmp_path):
+    path = tmp_path / 'example.cnf'
+    path.write_bytes(CNF)
+    expected = read_dimacs(io.BytesIO(CNF))
+    assert read_dimacs(path) == expected
+    assert read_dimacs(str(path), use_mmap=True, chunk_size=5) == expected
+    with open(path, 'rb') as file:
+        assert read_dimacs(file, use_mmap=True) == expected
+    assert read_dimacs(io.BytesIO(CNF), use_mmap=True) == expected
+
+def test_read_dimacs_layout():
+    # clauses may span lines, share lines, leave off the last 0, and end at a '%' line
+    num_vars, clauses = read_dimacs(io.BytesIO(b"p cnf 3 3\n1 2\n -3 0 2 0\n3\n"))
+    assert num_vars == 3
+    assert clauses == [[1, 2, -3], [2], [3]]
+    num_vars, clauses = read_dimacs(io.BytesIO(b"p cnf 2 1\n1 -2 0\n%\n0\n"))
+    assert clauses == [[1, -2]]
+    # variables past the problem line count are still counted
+    assert read_dimacs(io.BytesIO(b"p cnf 1 1\n1 -7 0\n"))[0] == 7
+
+def test_read_dimacs_malformed():
+    with pytest.raises(ValueError):
+        read_dimacs(io.BytesIO(b"p dnf 3 1\n1 0\n"))
+    with pytest.raises(ValueError):
+        read_dimacs(io.BytesIO(b"p cnf 3 1\n1 x 0\n"))
+
+def test_dpll_from_dimacs():
+    dpll = DPLL.from_dimacs(io.BytesIO(CNF))
+    assert len(dpll) == 4
+    assert len(dpll.get_variables()) == 5
+    vars = dpll.solve_for_variables()
+    assert isinstance(vars, dict)
+    for clause in ([1, -2, 3], [-1, 4], [2, -3, 5], [-4, -5]):
+        assert any(vars[str(abs(lit))] == (lit > 0) for lit in clause)
+    dpll.ADD(Literal('4'))
+    dpll.ADD(Literal('5'))
+    assert dpll.solve_satisfiability() == 'unsat'
+
+def test_dpll_from_dimacs_proposition():
+    dpll = DPLL.from_dimacs(io.BytesIO(b"p cnf 2 2\n1 -2 0\n2 0\n"), cdcl=True)
+    one = Literal('1')
+    two = Literal('2')
+    prop = dpll.get_proposition()
+    assert prop == [Clause(one, two.NOT()), two]
+    assert two in dpll
+    assert len(dpll) == 2
+    assert dpll.solve_satisfiability() == 'sat'
+
+def test_dpll_to_dimacs(tmp_path):
+    from implications import implies, bicond
+    a = Literal('a')
+    b = Literal('b')
+    c = Literal('c')
+    dpll = DPLL(Clause(a, b.NOT()), c.NOT())
+    implies(a, c, dpll)
+    bicond(b, Clause(a, c), dpll)
+    cnf = tmp_path / 'prop.cnf'
+    names = tmp_path / 'prop.json'
+    dpll.to_dimacs(cnf, names)
+    num_vars, clauses = read_dimacs(cnf)
+    assert num_vars == 3
+    assert clauses[:2] == [[1, -2], [-3]]
+    loaded = DPLL.from_dimacs(cnf, names=names)
+    assert list(loaded.get_variables()) == ['a', 'b', 'c']
+    assert [str(item) for item in loaded] == [str(item) for item in dpll]
+    assert loaded.solve_for_variables() == dpll.solve_for_variables()
+    with pytest.raises(ValueError):
+        DPLL.from_dimacs(cnf, names=io.StringIO('["a", "a", "b"]'))
+
+def test_dpll_to_dimacs_round_trip_ints():
+    out = io.StringIO()
+    DPLL.from_dimacs(io.BytesIO(CNF)).to_dimacs(out)
+    assert read_dimacs(io.StringIO(out.getvalue())) == read_dimacs(io.BytesIO(CNF))
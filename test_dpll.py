@@ -454,3 +454,195 @@ def test_init_conds_3():
     assert len(vars)
 
 
+
+def test_cdcl_solve_unsat():
+    a = Literal('a')
+    a_neg = a.NOT()
+    b = Literal('b')
+    b_neg = b.NOT()
+    c = Literal('c')
+    c_neg = c.NOT()
+    cl = Clause(a, b)
+    cl2 = Clause(a_neg, c)
+    cl3 = Clause(b_neg, c_neg)
+    cl4 = Clause(a_neg, b_neg)
+    cl5 = Clause(a, c_neg)
+    cl6 = Clause(a_neg, b)
+    cl7 = Clause(a, b_neg)
+    dpll = DPLL(cl, cl2, cl3, cl4, cl5, cl6, cl7, cdcl=True)
+    sat = dpll.solve_satisfiability()
+    assert sat == 'unsat'
+
+def test_cdcl_solve_for_variables():
+    a = Literal('a')
+    b = Literal('b')
+    c = Literal('c')
+    d = Literal('d')
+    e = Literal('e')
+    cl = Clause(a, b.NOT(), c)
+    cl2 = Clause(a.NOT(), d)
+    cl3 = Clause(b, c.NOT(), e)
+    cl4 = Clause(d.NOT(), e.NOT())
+    dpll = DPLL(cl, cl2, cl3, cl4, cdcl=True)
+    vars = dpll.solve_for_variables()
+    assert isinstance(vars, dict)
+    for clause in (cl, cl2, cl3, cl4):
+        assert any(vars[lit.get_variable()] == (lit.get_sign() == 'pos') for lit in clause)
+    dpll.set_initial_conditions(a=True, e=True)
+    assert dpll.solve_for_variables() is None
+
+def test_dpll_solve_assumptions():
+    a = Literal('a')
+    b = Literal('b')
+    c = Literal('c')
+    dpll = DPLL(Clause(a, b), Clause(a.NOT(), c), cdcl=True)
+    assert dpll.solve([a.NOT()]) == 'sat'
+    assert dpll.solve([a.NOT(), b.NOT()]) == 'unsat'
+    assert dpll.solve([Literal('z')]) == 'sat'
+    vars = dpll.solve_for_variables([c.NOT()])
+    assert vars['a'] is False and vars['b'] is True
+    dpll.ADD(b.NOT())
+    assert dpll.solve() == 'sat'
+    assert dpll.solve([c.NOT()]) == 'unsat'
+    # the Literals are not changed by solving
+    assert all(lit.get_internal_status() is None for cl in dpll for lit in 
+               ([cl] if isinstance(cl, Literal) else cl))
+
+def test_dpll_push_pop():
+    a = Literal('a')
+    b = Literal('b')
+    c = Literal('c')
+    dpll = DPLL(Clause(a, b), cdcl=True)
+    assert dpll.solve() == 'sat'
+    dpll.push()
+    dpll.ADD(a.NOT())
+    assert dpll.solve_for_variables() == {'a': False, 'b': True}
+    dpll.push()
+    dpll.ADD(Clause(b.NOT(), c))
+    dpll.ADD(c.NOT())
+    assert dpll.solve() == 'unsat'
+    dpll.pop()
+    assert len(dpll) == 2
+    assert dpll.solve([c.NOT()]) == 'sat'
+    dpll.pop()
+    assert dpll.get_proposition() == [Clause(a, b)]
+    assert dpll.solve([a.NOT(), c]) == 'sat'
+    with pytest.raises(ValueError):
+        dpll.pop()
+
+def test_dpll_push_pop_rebuilt_solver(tmp_path):
+    a = Literal('a')
+    b = Literal('b')
+    dpll = DPLL(Clause(a, b))
+    dpll.push()
+    dpll.ADD(a.NOT())
+    dpll.ADD(b)
+    assert dpll.solve() == 'sat'
+    # disregarding rebuilds the solver, which must reopen the scope
+    dpll._DPLL__disregard(b)
+    dpll.ADD(b.NOT())
+    assert dpll.solve() == 'unsat'
+    dpll.to_dimacs(tmp_path / 'p.cnf', tmp_path / 'p.json')
+    loaded = DPLL.from_dimacs(tmp_path / 'p.cnf', names=tmp_path / 'p.json')
+    assert loaded.get_variables() == {'a': None, 'b': None}
+    assert loaded.solve() == 'unsat'
+    dpll.pop()
+    assert dpll.solve_for_variables() is not None
+
+def test_dpll_disregard_in_scope():
+    a = Literal('a')
+    b = Literal('b')
+    c = Literal('c')
+    cl = Clause(a, b)
+    dpll = DPLL(cl, c, cl)
+    dpll.push()
+    dpll.ADD(a.NOT())
+    dpll.ADD(b.NOT())
+    dpll._DPLL__disregard(cl)
+    dpll._DPLL__disregard(c)
+    assert len(dpll) == 3
+    assert cl in dpll and c not in dpll
+    assert dpll.solve() == 'unsat'
+    # reading the proposition drops the removed items and moves the scope start with them
+    assert dpll.get_proposition() == [cl, a.NOT(), b.NOT()]
+    dpll.ADD(c)
+    assert dpll.solve() == 'unsat'
+    dpll.pop()
+    assert dpll.get_proposition() == [cl]
+    assert cl in dpll and a.NOT() not in dpll
+    assert dpll.solve() == 'sat'
+    dpll._DPLL__disregard(cl)
+    assert dpll.is_empty()
+
+def test_dpll_disregard_changed_clause():
+    a = Literal('a')
+    b = Literal('b')
+    c = Literal('c')
+    cl = Clause(a, b)
+    dpll = DPLL(cl, c)
+    cl.ADD(c.NOT())
+    assert cl in dpll
+    dpll._DPLL__disregard(cl)
+    assert cl not in dpll
+    assert dpll.get_proposition() == [c]
+
+def test_dpll_disregard_loaded(tmp_path):
+    a = Literal('a')
+    b = Literal('b')
+    DPLL(Clause(a, b), a.NOT(), b).to_dimacs(tmp_path / 'p.cnf', tmp_path / 'p.json')
+    loaded = DPLL.from_dimacs(tmp_path / 'p.cnf', names=tmp_path / 'p.json')
+    assert Clause(a, b) in loaded
+    loaded._DPLL__disregard(a.NOT())
+    loaded._DPLL__disregard(Clause(b, a))
+    # neither lookup decoded the clauses loaded as ints
+    assert loaded._DPLL__clauses == [None, None, [2]]
+    assert len(loaded) == 1
+    assert loaded.solve() == 'sat'
+    assert loaded.get_proposition() == [b]
+
+def test_dpll_rebuild_drops_activation_ids():
+    a = Literal('a')
+    b = Literal('b')
+    dpll = DPLL(Clause(a, b), b.NOT())
+    dpll.push()
+    dpll.ADD(a.NOT())
+    assert dpll.solve() == 'unsat'
+    names = len(dpll._DPLL__var_names)
+    for _ in range(3):
+        # each disregard drops the solver, and the rebuilt one opens the scope again
+        dpll._DPLL__disregard(b.NOT())
+        assert dpll.solve() == 'sat'
+        dpll.ADD(b.NOT())
+        assert dpll.solve() == 'unsat'
+    assert len(dpll._DPLL__var_names) == names
+
+def test_dpll_verify_model():
+    a = Literal('a')
+    b = Literal('b')
+    c = Literal('c')
+    dpll = DPLL(Clause(a, b), c.NOT())
+    assert dpll.solve_for_variables([b]) is not None
+    verify = dpll._DPLL__verify
+    assert verify([None, False, True, False], [2])
+    assert not verify([None, False, False, False], [])
+    assert not verify([None, True, False, True], [])
+    assert not verify([None, True, False, False], [2])
+
+def test_dpll_preprocess():
+    from implications import bicond
+    a = Literal('a')
+    b = Literal('b')
+    c = Literal('c')
+    x = Literal('x')
+    for cdcl in (False, True):
+        dpll = DPLL(preprocess=True, cdcl=cdcl)
+        bicond(x, Clause(a, b), dpll)
+        dpll.ADD(Clause(x.NOT(), c))
+        dpll.ADD(Clause(a.NOT(), b.NOT()))
+        # x is eliminated, but still given a value consistent with the proposition
+        vars = dpll.solve_for_variables()
+        assert vars['x'] == (vars['a'] or vars['b'])
+        assert dpll.solve_for_variables([c.NOT()]) == {'x': False, 'a': False, 'b': False, 'c': False}
+        dpll.ADD(a)
+        dpll.ADD(c.NOT())
+        assert dpll.solve() == 'unsat'
@@ -107,3 +107,32 @@ def test_literal_bool():
     assert bool(a)
 
 
+
+def test_literal_interned():
+    """test that there is one Literal per variable and sign"""
+    a = Literal('a')
+    assert Literal('a') is a
+    assert a.NOT() is a.NOT()
+    assert a.NOT().NOT() is a
+    assert copy.deepcopy(a.NOT()) is a.NOT()
+    with pytest.raises(AttributeError):
+        a._Literal__sign = '-'
+
+def test_literal_shared_status():
+    """test that both Literals of a variable share its status, until neither is in use"""
+    a_neg = Literal('a').NOT()
+    Literal('a').set_internal_status(False)
+    assert a_neg.get_internal_status() == False
+    assert a_neg.get_external_status() == True
+    del a_neg
+    assert Literal('a').get_internal_status() is None
+
+def test_literal_status_by_id():
+    """test that the statuses of many variables are kept apart in the assignment store"""
+    lits = [Literal(f'v{i}') for i in range(100)]
+    for i, lit in enumerate(lits):
+        lit.set_internal_status(i % 3 == 0)
+    for i, lit in enumerate(lits):
+        assert lit.get_internal_status() == (i % 3 == 0)
+        assert lit.NOT().get_external_status() == (i % 3 != 0)
+        assert type(lit.NOT().get_external_status()) is bool
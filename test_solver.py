@@ -0,0 +1,325 @@
+"""Test suite for solver.py"""
+
+import pytest
+from solver import Solver, VarOrder
+
+
+def pigeonhole(pigeons: int, holes: int) -> list[list[int]]:
+    """Returns: the clauses putting every pigeon in a hole and no two pigeons in the same hole,
+    where variable holes * p + h + 1 is pigeon p in hole h; the clause of each pigeon comes 
+    first, in order"""
+    var = lambda p, h: holes * p + h + 1
+    clauses = [[var(p, h) for h in range(holes)] for p in range(pigeons)]
+    for h in range(holes):
+        for p in range(pigeons):
+            for q in range(p + 1, pigeons):
+                clauses.append([-var(p, h), -var(q, h)])
+    return clauses
+
+def test_solver_instance():
+    solver = Solver()
+    assert isinstance(solver, Solver)
+    assert solver.get_num_vars() == 0
+
+def test_solver_new_var():
+    solver = Solver(2)
+    assert solver.new_var() == 3
+    assert solver.get_num_vars() == 3
+
+def test_solver_add_clause():
+    solver = Solver(3)
+    solver.add_clause([1, -2, 1])
+    solver.add_clause([3, -3])
+    assert solver.get_clauses() == [[1, -2]]
+    with pytest.raises(ValueError):
+        solver.add_clause([4])
+    with pytest.raises(ValueError):
+        solver.add_clause([0])
+
+def test_solver_solve_empty():
+    assert Solver().solve() == 'sat'
+    assert Solver(1, [[]]).solve() == 'unsat'
+
+def test_solver_solve_basic():
+    assert Solver(1, [[1]]).solve() == 'sat'
+    assert Solver(1, [[1], [-1]]).solve() == 'unsat'
+    assert Solver(3, [[1, 2], [-1, 3], [-2, -3], [-1, -2], [1, -3], [-1, 2], [1, -2]]).solve() == 'unsat'
+
+def test_solver_model():
+    clauses = [[1, -2, 3], [-1, 4], [2, -3, 5], [-4, -5]]
+    solver = Solver(5, clauses)
+    assert solver.solve() == 'sat'
+    model = solver.get_model()
+    for clause in clauses:
+        assert any(model[abs(lit)] == (lit > 0) for lit in clause)
+
+def test_solver_pigeonhole_unsat():
+    # 4 pigeons in 3 holes
+    clauses = pigeonhole(4, 3)
+    assert Solver(12, clauses).solve() == 'unsat'
+
+def test_solver_watched_propagation_chain():
+    # 1 and (v -> v + 1) for every v forces every variable True through propagation alone
+    n = 2000
+    clauses = [[1]] + [[-v, v + 1] for v in range(1, n)]
+    solver = Solver(n, clauses)
+    assert solver.solve() == 'sat'
+    assert all(solver.get_model()[1:])
+    solver.add_clause([-n])
+    assert solver.solve() == 'unsat'
+
+def test_solver_backtracks_failed_guess():
+    # guessing 1 True forces both 2 and -2, so the solver must backtrack and set 1 False
+    solver = Solver(3, [[-1, 2], [-1, -2], [1, 3]])
+    assert solver.solve() == 'sat'
+    model = solver.get_model()
+    assert model[1] is False
+    assert model[3] is True
+    assert solver.solve() == 'sat'
+    assert solver.get_model() == model
+
+def test_solver_deep_search_no_recursion_limit():
+    # nothing propagates, so every variable is guessed on its own decision level
+    n = 20000
+    solver = Solver(n, [[v, v + 1] for v in range(1, n)])
+    assert solver.solve() == 'sat'
+
+def test_solver_cdcl():
+    clauses = pigeonhole(4, 3)
+    solver = Solver(12, clauses, cdcl=True)
+    assert solver.solve() == 'unsat'
+    assert len(solver.get_learnts())
+    solver = Solver(3, [[-1, 2], [-1, -2], [1, 3]], cdcl=True)
+    assert solver.solve() == 'sat'
+    assert solver.get_model()[1] is False
+
+def test_var_order():
+    activity = [0.0, 1.0, 5.0, 3.0, 4.0]
+    order = VarOrder(activity)
+    for var in range(1, 5):
+        order.insert(var)
+    order.insert(2)
+    assert len(order) == 4
+    assert 3 in order
+    activity[1] = 10.0
+    order.update(1)
+    assert [order.pop() for _ in range(4)] == [1, 2, 4, 3]
+    assert 3 not in order
+
+def test_solver_luby():
+    assert [Solver.luby(i) for i in range(15)] == [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8]
+
+def test_solver_restart_policies():
+    clauses = pigeonhole(5, 4)
+    for policy in ('luby', 'geometric', 'glucose', None):
+        assert Solver(20, clauses, cdcl=True, restarts=policy).solve() == 'unsat'
+        assert Solver(20, clauses[:-1], cdcl=True, restarts=policy).solve() == 'sat'
+    with pytest.raises(ValueError):
+        Solver(restarts='never')
+
+def test_solver_reduce_learnts(monkeypatch):
+    monkeypatch.setattr(Solver, 'REDUCE_INTERVAL', 20)
+    monkeypatch.setattr(Solver, 'REDUCE_INCREMENT', 0)
+    clauses = pigeonhole(6, 5)
+    solver = Solver(30, clauses, cdcl=True)
+    assert solver.solve() == 'unsat'
+    learnts = solver.get_learnts()
+    assert all(isinstance(cl.lbd, int) for cl in learnts)
+    monkeypatch.setattr(Solver, 'REDUCE_INTERVAL', 10 ** 9)
+    unbounded = Solver(30, clauses, cdcl=True)
+    assert unbounded.solve() == 'unsat'
+    assert len(learnts) < len(unbounded.get_learnts())
+
+def test_solver_reduce_learnts_across_solves(monkeypatch):
+    monkeypatch.setattr(Solver, 'REDUCE_INTERVAL', 10)
+    monkeypatch.setattr(Solver, 'REDUCE_INCREMENT', 0)
+    # each call takes fewer conflicts than the interval, so only counting them across calls
+    # reaches it
+    solver = Solver(20, pigeonhole(5, 4)[1:], cdcl=True)
+    for h in range(4):
+        assert solver.solve([h + 1]) == 'unsat'
+    assert solver._Solver__reductions > 0
+    assert solver.solve() == 'sat'
+
+def test_solver_assumptions():
+    for cdcl in (False, True):
+        solver = Solver(3, [[1, 2], [-1, 3], [-2, 3]], cdcl=cdcl)
+        assert solver.solve([-3]) == 'unsat'
+        assert solver.solve([-1]) == 'sat'
+        model = solver.get_model()
+        assert model[1] is False and model[2] is True
+        assert solver.solve([1, -1]) == 'unsat'
+        assert solver.solve() == 'sat'
+        solver.add_clause([-3])
+        assert solver.solve() == 'unsat'
+        with pytest.raises(ValueError):
+            solver.solve([4])
+
+def test_solver_keeps_learnts_between_solves():
+    clauses = pigeonhole(5, 4)
+    # pigeon 4 can only be placed by leaving out one of the other pigeons
+    solver = Solver(20, clauses[1:], cdcl=True)
+    # pigeon p in hole h is variable 4 * p + h + 1
+    assert solver.solve([-(h + 1) for h in range(4)]) == 'sat'
+    learnts = len(solver.get_learnts())
+    assert solver.solve([17, 13]) == 'unsat'
+    assert solver.solve() == 'sat'
+    assert len(solver.get_learnts()) >= learnts
+
+def test_solver_push_pop():
+    for cdcl in (False, True):
+        solver = Solver(3, [[1, 2, 3]], cdcl=cdcl)
+        act = solver.push()
+        assert solver.get_scopes() == [act]
+        solver.add_clause([-1])
+        solver.add_clause([-2])
+        assert solver.solve() == 'sat'
+        solver.push()
+        solver.add_clause([-3])
+        assert solver.solve() == 'unsat'
+        solver.pop()
+        assert solver.solve() == 'sat'
+        assert solver.get_model()[3] is True
+        solver.pop()
+        assert solver.get_scopes() == []
+        assert [sorted(clause) for clause in solver.get_clauses()] == [[1, 2, 3]]
+        assert solver.solve([-1, -2]) == 'sat'
+        # the activation variable of a closed scope is reused
+        assert solver.push() == act
+        with pytest.raises(ValueError):
+            solver.pop()
+            solver.pop()
+
+def test_solver_pop_drops_learnts():
+    clauses = pigeonhole(5, 4)
+    solver = Solver(20, clauses[1:], cdcl=True)
+    act = solver.push()
+    solver.add_clause(clauses[0])
+    assert solver.solve() == 'unsat'
+    assert any(-act in clause for clause in solver.get_learnts())
+    solver.pop()
+    assert all(-act not in clause for clause in solver.get_learnts())
+    assert solver.solve() == 'sat'
+
+def test_solver_simplify_level_zero():
+    for cdcl in (False, True):
+        solver = Solver(4, [[1, 2, 3, 4], [-1, 2, 3], [2, 4], [-4, 3]], cdcl=cdcl)
+        solver.add_clause([-2])
+        assert solver.solve() == 'sat'
+        # -2 forces 4 then 3, so every clause is True at level 0
+        assert solver.get_clauses() == []
+        assert solver.solve([-3]) == 'unsat'
+        solver = Solver(4, [[1, 2, 3, 4], [-1, 2, 3, -4]], cdcl=cdcl)
+        solver.add_clause([-2])
+        assert solver.solve() == 'sat'
+        assert [sorted(clause) for clause in solver.get_clauses()] == [[1, 3, 4], [-4, -1, 3]]
+        assert solver.solve([2]) == 'unsat'
+
+def test_solver_occurrences():
+    solver = Solver(3, [[1, 2], [-1, 2, 3], [1, -3]])
+    assert solver.get_occurrences(1) == [[1, 2], [1, -3]]
+    assert solver.get_occurrences(-3) == [[1, -3]]
+    act = solver.push()
+    solver.add_clause([-2, 3])
+    assert solver.get_occurrences(-act) == [[-2, 3, -act]]
+    solver.pop()
+    assert solver.get_occurrences(-2) == [] and solver.get_occurrences(-act) == []
+    solver = Solver(3, [[1, 2, 3], [-1, 2], [1, -3, 2]])
+    solver.add_clause([-1])
+    assert solver.solve() == 'sat'
+    # -1 deletes [-1, 2] and removes 1 from the other clauses
+    assert solver.get_occurrences(1) == [] and solver.get_occurrences(-1) == []
+    assert sorted(sorted(cl) for cl in solver.get_occurrences(2)) == [[-3, 2], [2, 3]]
+
+def test_solver_pure_literals():
+    solver = Solver(3, [[1, -2], [1, -2, -3], [2, 3]])
+    # -2 occurs more often, but once 1 is assumed both 2 and 3 are pure
+    assert solver.solve([1]) == 'sat'
+    assert solver.get_model() == [None, True, True, True]
+    assert solver.solve([-1]) == 'sat'
+    assert solver.get_model() == [None, False, False, True]
+
+def test_solver_eliminate():
+    for cdcl in (False, True):
+        # 2 only links 1 to 3, so eliminating it leaves the resolvent [1, 3]
+        solver = Solver(4, [[1, 2], [-2, 3], [-3, 4], [-1, -4]], cdcl=cdcl, preprocess=True)
+        assert solver.solve([-4]) == 'sat'
+        model = solver.get_model()
+        assert model[2] is not None
+        assert all(any(model[abs(lit)] == (lit > 0) for lit in clause) 
+                   for clause in [[1, 2], [-2, 3], [-3, 4], [-1, -4]])
+        assert all(2 not in clause and -2 not in clause for clause in solver.get_clauses())
+        # an eliminated variable is restored when it is mentioned again
+        solver.add_clause([-2])
+        assert solver.solve() == 'sat'
+        assert solver.get_model()[2] is False
+        assert solver.solve([4]) == 'unsat'
+
+def test_solver_never_decides_eliminated(monkeypatch):
+    decided = []
+    decide = Solver._Solver__decide
+    monkeypatch.setattr(Solver, '_Solver__decide', 
+                        lambda solver, lit: decided.append(abs(lit)) or decide(solver, lit))
+    for cdcl in (False, True):
+        solver = Solver(6, [[1, 2], [-2, 3], [-3, 4], [-1, -4], [5, 6], [-5, 6]], cdcl=cdcl, 
+                        preprocess=True)
+        assert solver.solve() == 'sat'
+        eliminated = solver._Solver__eliminated
+        assert eliminated
+        assert not set(decided) & set(eliminated)
+        decided.clear()
+
+def test_solver_subsume(monkeypatch):
+    # no variable can be eliminated, so only subsumption changes the clauses
+    monkeypatch.setattr(Solver, 'ELIM_CLAUSE_LIMIT', 0)
+    for cdcl in (False, True):
+        solver = Solver(4, [[1, 2, 3], [1, 2], [-1, 2, 4], [-2, -3], [-4, 3, -1]], cdcl=cdcl, 
+                        preprocess=True)
+        assert solver.solve() == 'sat'
+        # [1, 2] subsumes [1, 2, 3] and strengthens [-1, 2, 4] to [2, 4]
+        assert sorted(sorted(clause) for clause in solver.get_clauses()) == \
+            [[-4, -1, 3], [-3, -2], [1, 2], [2, 4]]
+        solver.add_clause([-2])
+        assert solver.solve() == 'sat'
+        assert solver.get_model()[1:] == [True, False, True, True]
+
+def test_solver_probe(monkeypatch):
+    # no variable is eliminated
+    monkeypatch.setattr(Solver, 'ELIM_OCCUR_LIMIT', -1)
+    clauses = [[-1, 2], [-1, 3], [-2, -3, 4], [-2, -3, -4], [1, 4, 5], [1, -4, -5]]
+    solver = Solver(5, clauses, preprocess=True)
+    assert solver.solve() == 'sat'
+    # 1 implies 2 and 3, which cannot both be True, so probing 1 fails and -1 is a unit clause
+    assert solver.solve() == 'sat'
+    assert all(1 not in clause and -1 not in clause for clause in solver.get_clauses())
+    # nothing has been added since, so later calls do not probe again
+    probes = []
+    probe = Solver._Solver__probe
+    monkeypatch.setattr(Solver, '_Solver__probe', 
+                        lambda solver: probes.append(solver) or probe(solver))
+    assert solver.solve([4]) == 'sat'
+    assert solver.solve([-4]) == 'sat'
+    assert not probes
+    solver.add_clause([2, 5])
+    assert solver.solve() == 'sat'
+    assert len(probes) == 1
+
+def test_solver_substitute(monkeypatch):
+    # no variable is eliminated, so only substitution changes the clauses
+    monkeypatch.setattr(Solver, 'ELIM_OCCUR_LIMIT', -1)
+    clauses = [[-1, 2], [-2, -3], [3, 1], [2, 3, 4], [-2, 4, 5], [-4, -5, 3]]
+    for cdcl in (False, True):
+        solver = Solver(5, clauses, cdcl=cdcl, preprocess=True)
+        assert solver.solve() == 'sat'
+        # 1, 2 and -3 imply each other, so 2 and 3 are replaced by 1 and -1
+        assert all(abs(lit) not in (2, 3) for clause in solver.get_clauses() for lit in clause)
+        model = solver.get_model()
+        assert model[1] == model[2] != model[3]
+        assert all(any(model[abs(lit)] == (lit > 0) for lit in clause) for clause in clauses)
+        # a substituted variable is restored when it is assumed
+        assert solver.solve([-2, 4]) == 'sat'
+        assert solver.get_model()[1:4] == [False, False, True]
+        assert solver.solve([2, 3]) == 'unsat'
+        # a literal equivalent to its own negation makes the clauses unsatisfiable
+        assert Solver(2, [[1, 2], [-2, -1], [-1, 2], [-2, 1]], cdcl=cdcl, 
+                      preprocess=True).solve() == 'unsat'